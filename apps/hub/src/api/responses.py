@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSONResponse rendered by pydantic-core's serializer instead of ``json.dumps``.
+
+    Handles datetimes, enums, tuples and models natively; non-finite floats are
+    emitted as ``null`` so the body is always valid JSON.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content, inf_nan_mode="null")
@@ -218,7 +218,7 @@ async def sign_in_with_apple(payload: AppleSignInRequest) -> AppleSignInResponse
     if not settings.apple_oauth_client_ids:
         raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Apple sign-in is not configured")
     try:
-        identity = verify_apple_id_token(payload.id_token, allowed_client_ids=settings.apple_oauth_client_ids)
+        identity = await verify_apple_id_token(payload.id_token, allowed_client_ids=settings.apple_oauth_client_ids)
         user = plant_catalog.upsert_apple_user(apple_sub=identity.subject, email=identity.email, display_name=identity.display_name)
     except AppleIdentityError as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(exc)) from exc
@@ -21,6 +21,7 @@ from services.alerts import alerts_service
 from services.device_registry import device_registry
 from services.pot_ids import normalize_pot_id
 from services.pump_status import pump_status_cache
+from services.weather_hrrr import iter_cache_files
 
 HEARTBEAT_WARN_SECONDS = 180.0
 HEARTBEAT_CRITICAL_SECONDS = 300.0
@@ -32,6 +33,7 @@ logger = logging.getLogger("projectplant.hub.health")
 
 CACHE_ENTRY_ORDERS = {"newest", "oldest", "largest", "smallest"}
 CACHE_ENTRY_KINDS = {"grib", "metadata", "log", "other"}
+_LABEL_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_-]+")
 
 
 class CacheEntryModel(BaseModel):
@@ -580,16 +582,11 @@ def _collect_cache_entries(
     if not cache_dir.exists():
         return []
     entries: List[Dict[str, object]] = []
-    for path in cache_dir.rglob("*"):
-        if not path.is_file():
-            continue
+    for raw_path, stat in iter_cache_files(cache_dir):
+        path = Path(raw_path)
         kind = _classify_cache_file(path)
         if kinds and kind not in kinds:
             continue
-        try:
-            stat = path.stat()
-        except FileNotFoundError:
-            continue
         metadata = None
         has_metadata: bool | None = None
         if kind == "grib":
@@ -831,7 +828,7 @@ def _read_grib_metadata(path: Path) -> Dict[str, object] | None:
 def _slugify_label(label: str | None) -> str | None:
     if not label:
         return None
-    cleaned = re.sub(r"[^A-Za-z0-9_-]+", "-", label.strip())
+    cleaned = _LABEL_UNSAFE_RE.sub("-", label.strip())
     cleaned = cleaned.strip("-_")
     return cleaned or None
 
@@ -850,13 +847,7 @@ def _scan_cache_dir(cache_dir: Path) -> Dict[str, object]:
             "oldest_modified": None,
         }
 
-    for path in cache_dir.rglob("*"):
-        if not path.is_file():
-            continue
-        try:
-            stat = path.stat()
-        except FileNotFoundError:
-            continue
+    for _, stat in iter_cache_files(cache_dir):
         file_count += 1
         total_bytes += stat.st_size
         modified = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
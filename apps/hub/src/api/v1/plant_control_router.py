@@ -3,7 +3,7 @@ from __future__ import annotations
 import logging
 import time
 from datetime import datetime, timezone
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
 from fastapi import APIRouter, HTTPException, Query, Response
 from pydantic import BaseModel, ConfigDict, Field
@@ -67,6 +67,32 @@ def _normalize_status_payload(payload: dict[str, Any], pot_id: str, request_id:
     return normalized
 
 
+CommandTimeout = Annotated[
+    float | None,
+    Field(
+        ge=0.1,
+        le=30.0,
+        description="Optional timeout (seconds) to wait for a status update after issuing the command.",
+    ),
+]
+PositiveDurationMs = Annotated[
+    float | int | None,
+    Field(
+        alias="durationMs",
+        gt=0,
+        description="Optional run duration in milliseconds. Positive values only.",
+    ),
+]
+NonNegativeDurationMs = Annotated[
+    float | int | None,
+    Field(
+        alias="durationMs",
+        ge=0,
+        description="Optional run duration in milliseconds. Non-negative values only.",
+    ),
+]
+
+
 class SensorReadPayload(BaseModel):
     potId: str
     moisture: float
@@ -93,90 +119,40 @@ class SensorReadPayload(BaseModel):
 
 class PumpControlRequest(BaseModel):
     on: bool
-    duration_ms: float | int | None = Field(
-        default=None,
-        alias="durationMs",
-        gt=0,
-        description="Optional pump run duration in milliseconds. Positive values only.",
-    )
-    timeout: float | None = Field(
-        default=None,
-        ge=0.1,
-        le=30.0,
-        description="Optional timeout (seconds) to wait for a status update after issuing the pump command.",
-    )
+    duration_ms: PositiveDurationMs = None
+    timeout: CommandTimeout = None
 
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
 
 class IcZone1ControlRequest(BaseModel):
     on: bool
-    duration_ms: float | int | None = Field(
-        default=None,
-        alias="durationMs",
-        gt=0,
-        description="Optional IC Zone 1 run duration in milliseconds. Positive values only.",
-    )
-    timeout: float | None = Field(
-        default=None,
-        ge=0.1,
-        le=30.0,
-        description="Optional timeout (seconds) to wait for a status update after issuing the IC Zone 1 command.",
-    )
+    duration_ms: PositiveDurationMs = None
+    timeout: CommandTimeout = None
 
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
 
 class FanControlRequest(BaseModel):
     on: bool
-    duration_ms: float | int | None = Field(
-        default=None,
-        alias="durationMs",
-        ge=0,
-        description="Optional fan run duration in milliseconds. Non-negative values only.",
-    )
-    timeout: float | None = Field(
-        default=None,
-        ge=0.1,
-        le=30.0,
-        description="Optional timeout (seconds) to wait for a status update after issuing the fan command.",
-    )
+    duration_ms: NonNegativeDurationMs = None
+    timeout: CommandTimeout = None
 
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
 
 class MisterControlRequest(BaseModel):
     on: bool
-    duration_ms: float | int | None = Field(
-        default=None,
-        alias="durationMs",
-        ge=0,
-        description="Optional mister run duration in milliseconds. Non-negative values only.",
-    )
-    timeout: float | None = Field(
-        default=None,
-        ge=0.1,
-        le=30.0,
-        description="Optional timeout (seconds) to wait for a status update after issuing the mister command.",
-    )
+    duration_ms: NonNegativeDurationMs = None
+    timeout: CommandTimeout = None
 
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
 
 class LightControlRequest(BaseModel):
     on: bool
-    duration_ms: float | int | None = Field(
-        default=None,
-        alias="durationMs",
-        ge=0,
-        description="Optional light run duration in milliseconds. Non-negative values only.",
-    )
-    timeout: float | None = Field(
-        default=None,
-        ge=0.1,
-        le=30.0,
-        description="Optional timeout (seconds) to wait for a status update after issuing the light command.",
-    )
+    duration_ms: NonNegativeDurationMs = None
+    timeout: CommandTimeout = None
 
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
@@ -189,12 +165,7 @@ class DeviceNameRequest(BaseModel):
         max_length=32,
         description="Display name to store on the device.",
     )
-    timeout: float | None = Field(
-        default=None,
-        ge=0.1,
-        le=30.0,
-        description="Optional timeout (seconds) to wait for the name update status.",
-    )
+    timeout: CommandTimeout = None
 
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
@@ -205,12 +176,7 @@ class SensorModeRequest(BaseModel):
         alias="sensorMode",
         description="Sensor mode for the device: full (with safety floats) or control_only (no sensors).",
     )
-    timeout: float | None = Field(
-        default=None,
-        ge=0.1,
-        le=30.0,
-        description="Optional timeout (seconds) to wait for the mode update status.",
-    )
+    timeout: CommandTimeout = None
 
     model_config = ConfigDict(extra="forbid", populate_by_name=True)
 
@@ -299,7 +265,8 @@ async def request_sensor_read(
     ),
 ) -> SensorReadPayload:
     start = time.monotonic()
-    logger.debug("sensor-read command received for %s (timeout=%s)", pot_id, timeout)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("sensor-read command received for %s (timeout=%s)", pot_id, timeout)
     try:
         result = await command_service.request_sensor_read(pot_id, timeout=timeout)
     except CommandTimeoutError as exc:
@@ -311,13 +278,13 @@ async def request_sensor_read(
         logger.error("sensor-read for %s failed: %s", pot_id, exc)
         raise HTTPException(status_code=503, detail=str(exc)) from exc
 
-    elapsed = time.monotonic() - start
-    logger.debug(
-        "sensor-read for %s completed in %.2fs (requestId=%s)",
-        pot_id,
-        elapsed,
-        result.request_id,
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "sensor-read for %s completed in %dms (requestId=%s)",
+            pot_id,
+            int((time.monotonic() - start) * 1000),
+            result.request_id,
+        )
     response.headers["X-Command-Request-Id"] = result.request_id
     payload = SensorReadPayload.from_result(result)
     await _persist_sensor_snapshot(payload, source="sensor-read", request_id=result.request_id)
@@ -333,13 +300,14 @@ async def control_pump(pot_id: str, payload: PumpControlRequest, response: Respo
     start = time.monotonic()
     request_on = payload.on
     request_duration_ms = payload.duration_ms
-    logger.debug(
-        "pump control command received for %s (on=%s, durationMs=%s, timeout=%s)",
-        pot_id,
-        request_on,
-        request_duration_ms,
-        payload.timeout,
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "pump control command received for %s (on=%s, durationMs=%s, timeout=%s)",
+            pot_id,
+            request_on,
+            request_duration_ms,
+            payload.timeout,
+        )
     try:
         result = await command_service.control_pump(
             pot_id,
@@ -356,13 +324,13 @@ async def control_pump(pot_id: str, payload: PumpControlRequest, response: Respo
         logger.error("pump control for %s failed: %s", pot_id, exc)
         raise HTTPException(status_code=503, detail=str(exc)) from exc
 
-    elapsed = time.monotonic() - start
-    logger.debug(
-        "pump control for %s completed in %.2fs (requestId=%s)",
-        pot_id,
-        elapsed,
-        result.request_id,
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "pump control for %s completed in %dms (requestId=%s)",
+            pot_id,
+            int((time.monotonic() - start) * 1000),
+            result.request_id,
+        )
     response.headers["X-Command-Request-Id"] = result.request_id
     sensor_payload = SensorReadPayload.from_result(result)
     plant_schedule_service.set_manual_override(
@@ -384,13 +352,14 @@ async def control_pump(pot_id: str, payload: PumpControlRequest, response: Respo
 )
 async def control_ic_zone1(pot_id: str, payload: IcZone1ControlRequest, response: Response) -> SensorReadPayload:
     start = time.monotonic()
-    logger.debug(
-        "ic zone 1 control command received for %s (on=%s, durationMs=%s, timeout=%s)",
-        pot_id,
-        payload.on,
-        payload.duration_ms,
-        payload.timeout,
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "ic zone 1 control command received for %s (on=%s, durationMs=%s, timeout=%s)",
+            pot_id,
+            payload.on,
+            payload.duration_ms,
+            payload.timeout,
+        )
     try:
         result = await command_service.control_ic_zone1(
             pot_id,
@@ -407,13 +376,13 @@ async def control_ic_zone1(pot_id: str, payload: IcZone1ControlRequest, response
         logger.error("ic zone 1 control for %s failed: %s", pot_id, exc)
         raise HTTPException(status_code=503, detail=str(exc)) from exc
 
-    elapsed = time.monotonic() - start
-    logger.debug(
-        "ic zone 1 control for %s completed in %.2fs (requestId=%s)",
-        pot_id,
-        elapsed,
-        result.request_id,
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "ic zone 1 control for %s completed in %dms (requestId=%s)",
+            pot_id,
+            int((time.monotonic() - start) * 1000),
+            result.request_id,
+        )
     response.headers["X-Command-Request-Id"] = result.request_id
     payload_model = SensorReadPayload.from_result(result)
     plant_schedule_service.set_manual_override(
@@ -435,13 +404,14 @@ async def control_ic_zone1(pot_id: str, payload: IcZone1ControlRequest, response
 )
 async def control_fan(pot_id: str, payload: FanControlRequest, response: Response) -> SensorReadPayload:
     start = time.monotonic()
-    logger.debug(
-        "fan control command received for %s (on=%s, durationMs=%s, timeout=%s)",
-        pot_id,
-        payload.on,
-        payload.duration_ms,
-        payload.timeout,
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "fan control command received for %s (on=%s, durationMs=%s, timeout=%s)",
+            pot_id,
+            payload.on,
+            payload.duration_ms,
+            payload.timeout,
+        )
     try:
         result = await command_service.control_fan(
             pot_id,
@@ -458,13 +428,13 @@ async def control_fan(pot_id: str, payload: FanControlRequest, response: Respons
         logger.error("fan control for %s failed: %s", pot_id, exc)
         raise HTTPException(status_code=503, detail=str(exc)) from exc
 
-    elapsed = time.monotonic() - start
-    logger.debug(
-        "fan control for %s completed in %.2fs (requestId=%s)",
-        pot_id,
-        elapsed,
-        result.request_id,
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "fan control for %s completed in %dms (requestId=%s)",
+            pot_id,
+            int((time.monotonic() - start) * 1000),
+            result.request_id,
+        )
     response.headers["X-Command-Request-Id"] = result.request_id
     payload_model = SensorReadPayload.from_result(result)
     plant_schedule_service.set_manual_override(
@@ -486,13 +456,14 @@ async def control_fan(pot_id: str, payload: FanControlRequest, response: Respons
 )
 async def control_mister(pot_id: str, payload: MisterControlRequest, response: Response) -> SensorReadPayload:
     start = time.monotonic()
-    logger.debug(
-        "mister control command received for %s (on=%s, durationMs=%s, timeout=%s)",
-        pot_id,
-        payload.on,
-        payload.duration_ms,
-        payload.timeout,
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "mister control command received for %s (on=%s, durationMs=%s, timeout=%s)",
+            pot_id,
+            payload.on,
+            payload.duration_ms,
+            payload.timeout,
+        )
     try:
         result = await command_service.control_mister(
             pot_id,
@@ -509,13 +480,13 @@ async def control_mister(pot_id: str, payload: MisterControlRequest, response: R
         logger.error("mister control for %s failed: %s", pot_id, exc)
         raise HTTPException(status_code=503, detail=str(exc)) from exc
 
-    elapsed = time.monotonic() - start
-    logger.debug(
-        "mister control for %s completed in %.2fs (requestId=%s)",
-        pot_id,
-        elapsed,
-        result.request_id,
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "mister control for %s completed in %dms (requestId=%s)",
+            pot_id,
+            int((time.monotonic() - start) * 1000),
+            result.request_id,
+        )
     response.headers["X-Command-Request-Id"] = result.request_id
     payload_model = SensorReadPayload.from_result(result)
     plant_schedule_service.set_manual_override(
@@ -537,13 +508,14 @@ async def control_mister(pot_id: str, payload: MisterControlRequest, response: R
 )
 async def control_light(pot_id: str, payload: LightControlRequest, response: Response) -> SensorReadPayload:
     start = time.monotonic()
-    logger.debug(
-        "light control command received for %s (on=%s, durationMs=%s, timeout=%s)",
-        pot_id,
-        payload.on,
-        payload.duration_ms,
-        payload.timeout,
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "light control command received for %s (on=%s, durationMs=%s, timeout=%s)",
+            pot_id,
+            payload.on,
+            payload.duration_ms,
+            payload.timeout,
+        )
     try:
         result = await command_service.control_light(
             pot_id,
@@ -560,13 +532,13 @@ async def control_light(pot_id: str, payload: LightControlRequest, response: Res
         logger.error("light control for %s failed: %s", pot_id, exc)
         raise HTTPException(status_code=503, detail=str(exc)) from exc
 
-    elapsed = time.monotonic() - start
-    logger.debug(
-        "light control for %s completed in %.2fs (requestId=%s)",
-        pot_id,
-        elapsed,
-        result.request_id,
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "light control for %s completed in %dms (requestId=%s)",
+            pot_id,
+            int((time.monotonic() - start) * 1000),
+            result.request_id,
+        )
     response.headers["X-Command-Request-Id"] = result.request_id
     payload_model = SensorReadPayload.from_result(result)
     plant_schedule_service.set_manual_override(
@@ -588,12 +560,13 @@ async def control_light(pot_id: str, payload: LightControlRequest, response: Res
 )
 async def set_device_name(pot_id: str, payload: DeviceNameRequest, response: Response) -> PumpStatusPayload:
     start = time.monotonic()
-    logger.debug(
-        "device name update received for %s (deviceName=%s, timeout=%s)",
-        pot_id,
-        payload.device_name,
-        payload.timeout,
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "device name update received for %s (deviceName=%s, timeout=%s)",
+            pot_id,
+            payload.device_name,
+            payload.timeout,
+        )
     try:
         result = await command_service.set_device_name(pot_id, name=payload.device_name, timeout=payload.timeout)
     except CommandTimeoutError as exc:
@@ -605,13 +578,13 @@ async def set_device_name(pot_id: str, payload: DeviceNameRequest, response: Res
         logger.error("device name update for %s failed: %s", pot_id, exc)
         raise HTTPException(status_code=503, detail=str(exc)) from exc
 
-    elapsed = time.monotonic() - start
-    logger.debug(
-        "device name update for %s completed in %.2fs (requestId=%s)",
-        pot_id,
-        elapsed,
-        result.request_id,
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "device name update for %s completed in %dms (requestId=%s)",
+            pot_id,
+            int((time.monotonic() - start) * 1000),
+            result.request_id,
+        )
     response.headers["X-Command-Request-Id"] = result.request_id
     payload = result.payload if isinstance(result.payload, dict) else {}
     normalized = _normalize_status_payload(payload, pot_id, result.request_id)
@@ -642,12 +615,13 @@ async def set_device_name(pot_id: str, payload: DeviceNameRequest, response: Res
 )
 async def set_sensor_mode(pot_id: str, payload: SensorModeRequest, response: Response) -> PumpStatusPayload:
     start = time.monotonic()
-    logger.debug(
-        "sensor mode update received for %s (sensorMode=%s, timeout=%s)",
-        pot_id,
-        payload.sensor_mode,
-        payload.timeout,
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "sensor mode update received for %s (sensorMode=%s, timeout=%s)",
+            pot_id,
+            payload.sensor_mode,
+            payload.timeout,
+        )
     try:
         result = await command_service.set_sensor_mode(pot_id, mode=payload.sensor_mode, timeout=payload.timeout)
     except CommandTimeoutError as exc:
@@ -659,13 +633,13 @@ async def set_sensor_mode(pot_id: str, payload: SensorModeRequest, response: Res
         logger.error("sensor mode update for %s failed: %s", pot_id, exc)
         raise HTTPException(status_code=503, detail=str(exc)) from exc
 
-    elapsed = time.monotonic() - start
-    logger.debug(
-        "sensor mode update for %s completed in %.2fs (requestId=%s)",
-        pot_id,
-        elapsed,
-        result.request_id,
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "sensor mode update for %s completed in %dms (requestId=%s)",
+            pot_id,
+            int((time.monotonic() - start) * 1000),
+            result.request_id,
+        )
     response.headers["X-Command-Request-Id"] = result.request_id
     payload_dict = result.payload if isinstance(result.payload, dict) else {}
     normalized = _normalize_status_payload(payload_dict, pot_id, result.request_id)
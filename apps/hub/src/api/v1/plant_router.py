@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import hashlib
+import secrets
+from functools import lru_cache
 from typing import Any, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import BaseModel, Field, TypeAdapter
+from pydantic_core import to_json
 
 from services.plant_lookup import PlantCareProfile, PlantDetails, PlantSuggestion, plant_lookup_service
 from services.plants import (
@@ -146,59 +150,88 @@ class IrrigationZoneCreateRequest(BaseModel):
     description: str | None = Field(default=None, max_length=200)
 
 
-@router.get("/reference", response_model=list[PlantReferenceModel])
-async def list_references(search: str | None = None) -> list[PlantReferenceModel]:
-    references = plant_catalog.search_references(search)
-    return [_to_reference_model(ref) for ref in references]
+_REFERENCE_LIST_ADAPTER = TypeAdapter(list[PlantReferenceModel])
+_POT_MODEL_LIST_ADAPTER = TypeAdapter(list[PotModelModel])
+_ZONE_LIST_ADAPTER = TypeAdapter(list[IrrigationZoneModel])
+_DETAILS_ADAPTER = TypeAdapter(PlantDetailsModel)
+_REFERENCE_CACHE_CONTROL = "max-age=60"
+_USER_CATALOG_CACHE_CONTROL = "private, max-age=60"
+# Distinguishes version-based ETags across restarts of the hub process.
+_ETAG_BOOT_ID = secrets.token_hex(8)
+SUGGESTION_LIMIT = 15
+_DEFAULT_TEMPERATURE_C = (18.0, 26.0)
+_DEFAULT_PH_RANGE = (6.0, 7.0)
+
+
+@router.get("/reference", responses={200: {"model": list[PlantReferenceModel]}})
+async def list_references(request: Request, search: str | None = None) -> Response:
+    query = search.strip().lower() if search else ""
+    body, etag = _encode_references(query, plant_catalog.references_version)
+    if request.headers.get("if-none-match") == etag:
+        return _not_modified(etag, _REFERENCE_CACHE_CONTROL)
+    return _cacheable_json_response(body, etag, _REFERENCE_CACHE_CONTROL)
 
 
 @router.get("/suggest", response_model=list[PlantSuggestionModel])
 async def suggest_plants(query: str = Query(..., min_length=2, description="Search term for plant lookup")) -> list[PlantSuggestionModel]:
     remote = await plant_lookup_service.suggest(query)
-    suggestions: list[PlantSuggestionModel] = [_to_suggestion_model(item) for item in remote]
-    local_refs = plant_catalog.search_references(query)
+    suggestions: list[PlantSuggestionModel] = [
+        _to_suggestion_model(item) for item in remote[:SUGGESTION_LIMIT]
+    ]
+    if len(suggestions) >= SUGGESTION_LIMIT:
+        return suggestions
+    remaining = SUGGESTION_LIMIT - len(suggestions)
     local_seen: set[str] = set()
-    for ref in local_refs:
-        key = ref.species.lower()
+    seen_add = local_seen.add
+    append = suggestions.append
+    construct = PlantSuggestionModel.model_construct
+    for ref in plant_catalog.search_references(query):
+        species = ref.species
+        key = species.lower()
         if key in local_seen:
             continue
-        suggestions.append(
-            PlantSuggestionModel(
-                scientific_name=ref.species,
+        seen_add(key)
+        append(
+            construct(
+                scientific_name=species,
                 common_name=ref.common_name,
                 source="local",
                 summary=ref.notes,
             )
         )
-        local_seen.add(key)
-    return suggestions[:15]
+        remaining -= 1
+        if not remaining:
+            break
+    return suggestions
 
 
 @router.get("/details", response_model=PlantDetailsModel)
-async def get_details(name: str = Query(..., description="Scientific name to resolve")) -> PlantDetailsModel:
+async def get_details(name: str = Query(..., description="Scientific name to resolve")) -> Response:
     try:
         detail = await plant_lookup_service.details(name)
     except RuntimeError as exc:  # pragma: no cover - networks stubbed in tests
         raise HTTPException(status_code=404, detail=str(exc)) from exc
-    return _to_details_model(detail)
+    return _json_response(_DETAILS_ADAPTER, _to_details_model(detail))
 
 
-@router.get("/pots", response_model=list[PotModelModel])
-async def list_pot_models(current_user: UserAccount = Depends(get_current_user)) -> list[PotModelModel]:
-    models = plant_catalog.list_pot_models(current_user.id)
-    return [
-        _to_pot_model(model, plant_catalog.role_for(current_user.id, model.owner_user_id))
-        for model in models
-    ]
+@router.get("/pots", responses={200: {"model": list[PotModelModel]}})
+async def list_pot_models(request: Request, current_user: UserAccount = Depends(get_current_user)) -> Response:
+    version = plant_catalog.version
+    etag = _user_catalog_etag(current_user.id, version)
+    if request.headers.get("if-none-match") == etag:
+        return _not_modified(etag, _USER_CATALOG_CACHE_CONTROL)
+    body = _encode_pot_models(current_user.id, version)
+    return _cacheable_json_response(body, etag, _USER_CATALOG_CACHE_CONTROL)
 
 
-@router.get("/zones", response_model=list[IrrigationZoneModel])
-async def list_irrigation_zones(current_user: UserAccount = Depends(get_current_user)) -> list[IrrigationZoneModel]:
-    zones = plant_catalog.list_zones(current_user.id)
-    return [
-        _to_zone_model(zone, plant_catalog.role_for(current_user.id, zone.owner_user_id))
-        for zone in zones
-    ]
+@router.get("/zones", responses={200: {"model": list[IrrigationZoneModel]}})
+async def list_irrigation_zones(request: Request, current_user: UserAccount = Depends(get_current_user)) -> Response:
+    version = plant_catalog.version
+    etag = _user_catalog_etag(current_user.id, version)
+    if request.headers.get("if-none-match") == etag:
+        return _not_modified(etag, _USER_CATALOG_CACHE_CONTROL)
+    body = _encode_zones(current_user.id, version)
+    return _cacheable_json_response(body, etag, _USER_CATALOG_CACHE_CONTROL)
 
 
 @router.post("/zones", response_model=IrrigationZoneModel, status_code=status.HTTP_201_CREATED)
@@ -267,20 +300,27 @@ async def detect_pot(current_user: UserAccount = Depends(get_current_user)) -> P
     return _to_pot_model(model, plant_catalog.role_for(current_user.id, model.owner_user_id))
 
 
-@router.get("", response_model=list[PlantResponse])
-async def list_plants(current_user: UserAccount = Depends(get_current_user)) -> list[PlantResponse]:
-    records = plant_catalog.list_records(current_user.id)
-    return [
-        _to_plant_response(record, plant_catalog.role_for(current_user.id, record.owner_user_id))
-        for record in records
-    ]
+@router.get("", responses={200: {"model": list[PlantResponse]}})
+async def list_plants(current_user: UserAccount = Depends(get_current_user)) -> Response:
+    viewer_id = current_user.id
+    role_for = plant_catalog.role_for
+    convert = _plant_payload
+    roles: dict[str, ShareRole] = {}
+    plants: list[dict[str, Any]] = []
+    for record in plant_catalog.list_records(viewer_id):
+        owner_id = record.owner_user_id
+        role = roles.get(owner_id)
+        if role is None:
+            role = roles[owner_id] = role_for(viewer_id, owner_id)
+        plants.append(convert(record, role))
+    return Response(content=to_json(plants, inf_nan_mode="null"), media_type="application/json")
 
 
-@router.post("", response_model=PlantResponse, status_code=status.HTTP_201_CREATED)
+@router.post("", status_code=status.HTTP_201_CREATED, responses={201: {"model": PlantResponse}})
 async def create_plant(
     payload: PlantCreateRequest,
     current_user: UserAccount = Depends(get_current_user),
-) -> PlantResponse:
+) -> Response:
     care_profile_dict = payload.care_profile.model_dump() if payload.care_profile else None
     care_level = payload.care_profile.level if payload.care_profile else "custom"
     care_source = payload.care_profile.source if payload.care_profile else None
@@ -307,11 +347,69 @@ async def create_plant(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     except CatalogPermissionError as exc:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
-    return _to_plant_response(record, plant_catalog.role_for(current_user.id, record.owner_user_id))
+    plant = _plant_payload(record, plant_catalog.role_for(current_user.id, record.owner_user_id))
+    return Response(content=to_json(plant, inf_nan_mode="null"), status_code=status.HTTP_201_CREATED, media_type="application/json")
+
+
+def _json_response(adapter: TypeAdapter[Any], value: Any) -> Response:
+    """Serialize already-validated models straight to JSON bytes.
+
+    Skips FastAPI's ``jsonable_encoder`` pass and the second validation it runs
+    against ``response_model``; the declared models stay for OpenAPI only.
+    """
+    return Response(content=adapter.dump_json(value), media_type="application/json")
+
+
+def _cacheable_json_response(body: bytes, etag: str, cache_control: str) -> Response:
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
+
+
+def _not_modified(etag: str, cache_control: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
+
+
+def _user_catalog_etag(user_id: str, version: int) -> str:
+    # Pot and zone listings are per viewer, so the tag carries the user as well
+    # as the catalog version. The version counter restarts on every boot, so a
+    # per-process nonce keeps tags from an earlier run from matching.
+    return f'W/"{_ETAG_BOOT_ID}:{user_id}:{version}"'
+
+
+@lru_cache(maxsize=256)
+def _encode_references(query: str, version: int) -> tuple[bytes, str]:
+    """Serialize the references matching ``query`` once per catalog version."""
+    references = plant_catalog.search_references(query or None)
+    body = _REFERENCE_LIST_ADAPTER.dump_json([_to_reference_model(ref) for ref in references])
+    return body, f'"{hashlib.blake2s(body).hexdigest()}"'
+
+
+@lru_cache(maxsize=128)
+def _encode_pot_models(user_id: str, version: int) -> bytes:
+    """Serialize the pot models visible to ``user_id`` once per catalog version."""
+    models = plant_catalog.list_pot_models(user_id)
+    return _POT_MODEL_LIST_ADAPTER.dump_json(
+        [_to_pot_model(model, plant_catalog.role_for(user_id, model.owner_user_id)) for model in models]
+    )
+
+
+@lru_cache(maxsize=128)
+def _encode_zones(user_id: str, version: int) -> bytes:
+    """Serialize the irrigation zones visible to ``user_id`` once per catalog version."""
+    zones = plant_catalog.list_zones(user_id)
+    return _ZONE_LIST_ADAPTER.dump_json(
+        [_to_zone_model(zone, plant_catalog.role_for(user_id, zone.owner_user_id)) for zone in zones]
+    )
 
 
 def _to_reference_model(ref: PlantReference) -> PlantReferenceModel:
-    return PlantReferenceModel(
+    return PlantReferenceModel.model_construct(
         species=ref.species,
         common_name=ref.common_name,
         light=ref.light,
@@ -324,19 +422,19 @@ def _to_reference_model(ref: PlantReference) -> PlantReferenceModel:
 
 
 def _to_suggestion_model(item: PlantSuggestion) -> PlantSuggestionModel:
-    return PlantSuggestionModel(
+    return PlantSuggestionModel.model_construct(
         scientific_name=item.scientific_name,
         common_name=item.common_name,
         source=item.source,
         rank=item.rank,
         image_url=item.image_url,
         summary=item.summary,
-        sources=list(item.sources),
+        sources=item.sources,
     )
 
 
 def _to_details_model(detail: PlantDetails) -> PlantDetailsModel:
-    return PlantDetailsModel(
+    return PlantDetailsModel.model_construct(
         scientific_name=detail.scientific_name,
         common_name=detail.common_name,
         family=detail.family,
@@ -347,7 +445,7 @@ def _to_details_model(detail: PlantDetails) -> PlantDetailsModel:
         summary=detail.summary,
         taxonomy=detail.taxonomy,
         image_url=detail.image_url,
-        images=list(detail.images),
+        images=detail.images,
         care=_to_care_model(detail.care),
         sources=detail.sources,
         powo_id=detail.powo_id,
@@ -360,7 +458,7 @@ def _to_details_model(detail: PlantDetails) -> PlantDetailsModel:
 
 
 def _to_pot_model(model: PotModel, role: ShareRole) -> PotModelModel:
-    return PotModelModel(
+    return PotModelModel.model_construct(
         id=model.id,
         name=model.name,
         volume_l=model.volume_l,
@@ -371,7 +469,7 @@ def _to_pot_model(model: PotModel, role: ShareRole) -> PotModelModel:
 
 
 def _to_zone_model(zone: IrrigationZone, role: ShareRole) -> IrrigationZoneModel:
-    return IrrigationZoneModel(
+    return IrrigationZoneModel.model_construct(
         id=zone.id,
         name=zone.name,
         irrigation_type=zone.irrigation_type,
@@ -386,7 +484,7 @@ def _to_zone_model(zone: IrrigationZone, role: ShareRole) -> IrrigationZoneModel
 
 
 def _to_care_model(care: PlantCareProfile) -> CareProfileModel:
-    return CareProfileModel(
+    return CareProfileModel.model_construct(
         light=care.light,
         water=care.water,
         humidity=care.humidity,
@@ -403,34 +501,43 @@ def _to_care_model(care: PlantCareProfile) -> CareProfileModel:
     )
 
 
-def _to_plant_response(record: PlantRecord, role: ShareRole) -> PlantResponse:
-    care_model = CareProfileModel(
-        light=str(record.ideal_conditions.get("light", "")),
-        water=str(record.ideal_conditions.get("water", "")),
-        humidity=str(record.ideal_conditions.get("humidity", "")),
-        temperature_c=tuple(record.ideal_conditions.get("temperature_c", (18.0, 26.0))),
-        ph_range=tuple(record.ideal_conditions.get("ph_range", (6.0, 7.0))),
-        notes=record.ideal_conditions.get("notes"),
-        level=record.care_level,  # type: ignore[arg-type]
-        source=record.care_source,
-        warning=record.care_warning,
-    )
-    return PlantResponse(
-        id=record.id,
-        nickname=record.nickname,
-        species=record.species,
-        common_name=record.common_name,
-        location_type=record.location_type,  # type: ignore[arg-type]
-        pot_model=record.pot_model,
-        irrigation_zone_id=record.irrigation_zone_id,
-        taxonomy=record.taxonomy,
-        summary=record.summary,
-        image_url=record.image_url,
-        ideal_conditions=care_model,
-        care_level=record.care_level,  # type: ignore[arg-type]
-        care_source=record.care_source,
-        care_warning=record.care_warning,
-        image_data=record.image_data,
-        owner_user_id=record.owner_user_id,
-        access_role=role,
-    )
+def _plant_payload(record: PlantRecord, role: ShareRole) -> dict[str, Any]:
+    """Build the ``PlantResponse`` JSON shape directly from a catalog record.
+
+    ``/plants`` is the hottest list endpoint, so this skips model instances
+    altogether; keys mirror ``PlantResponse``/``CareProfileModel`` field order.
+    """
+    conditions = record.ideal_conditions.get
+    return {
+        "id": record.id,
+        "nickname": record.nickname,
+        "species": record.species,
+        "common_name": record.common_name,
+        "location_type": record.location_type,
+        "pot_model": record.pot_model,
+        "irrigation_zone_id": record.irrigation_zone_id,
+        "taxonomy": record.taxonomy,
+        "summary": record.summary,
+        "image_url": record.image_url,
+        "ideal_conditions": {
+            "light": str(conditions("light", "")),
+            "water": str(conditions("water", "")),
+            "humidity": str(conditions("humidity", "")),
+            "temperature_c": tuple(conditions("temperature_c", _DEFAULT_TEMPERATURE_C)),
+            "ph_range": tuple(conditions("ph_range", _DEFAULT_PH_RANGE)),
+            "notes": conditions("notes"),
+            "level": record.care_level,
+            "source": record.care_source,
+            "warning": record.care_warning,
+            "allow_user_input": None,
+            "soil": None,
+            "spacing": None,
+            "lifecycle": None,
+        },
+        "care_level": record.care_level,
+        "care_source": record.care_source,
+        "care_warning": record.care_warning,
+        "image_data": record.image_data,
+        "owner_user_id": record.owner_user_id,
+        "access_role": role.value,
+    }
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 from typing import Literal, Optional
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Response
+from pydantic import BaseModel, Field, TypeAdapter, field_validator
 
 from services.provisioning import ProvisionedDeviceSnapshot, normalize_device_id, provisioning_store
 
@@ -23,6 +23,21 @@ class ProvisionWaitRequest(BaseModel):
         max_length=32,
     )
 
+    @field_validator("device_id")
+    @classmethod
+    def normalize_device(cls, value: Optional[str]) -> Optional[str]:
+        if not value:
+            return None
+        normalized = normalize_device_id(value)
+        if normalized is None:
+            raise ValueError("device_id must be a 12-digit hexadecimal string")
+        return normalized
+
+    @field_validator("method")
+    @classmethod
+    def normalize_method(cls, value: Optional[str]) -> Optional[str]:
+        return value.lower() if value is not None else None
+
 
 class ProvisionedDeviceModel(BaseModel):
     id: str
@@ -43,30 +58,35 @@ class ProvisionWaitResponse(BaseModel):
     method: Optional[str] = None
 
 
-@router.post("/wait", response_model=ProvisionWaitResponse)
-async def provision_wait(request: ProvisionWaitRequest) -> ProvisionWaitResponse:
-    normalized_id = normalize_device_id(request.device_id)
-    if request.device_id and normalized_id is None:
-        raise HTTPException(status_code=422, detail="device_id must be a 12-digit hexadecimal string")
+_WAIT_RESPONSE_ADAPTER = TypeAdapter(ProvisionWaitResponse)
 
-    timeout = max(0.5, min(request.timeout, 600.0))
-    method = request.method.lower() if isinstance(request.method, str) else None
+
+@router.post("/wait", responses={200: {"model": ProvisionWaitResponse}})
+async def provision_wait(request: ProvisionWaitRequest) -> Response:
+    # device_id and method arrive normalized by the request validators.
+    method = request.method
     event, elapsed = await provisioning_store.wait_for_device(
-        timeout=timeout,
-        device_id=normalized_id,
+        timeout=request.timeout,
+        device_id=request.device_id,
         require_fresh=request.require_fresh,
         method=method,
     )
 
     if event is None:
-        return ProvisionWaitResponse(status="timeout", device=None, elapsed=elapsed, method=method)
-
-    snapshot = _serialize_snapshot(event.device)
-    return ProvisionWaitResponse(status="online", device=snapshot, elapsed=elapsed, method=snapshot.method or method)
+        result = ProvisionWaitResponse.model_construct(status="timeout", device=None, elapsed=elapsed, method=method)
+    else:
+        snapshot = _serialize_snapshot(event.device)
+        result = ProvisionWaitResponse.model_construct(
+            status="online",
+            device=snapshot,
+            elapsed=elapsed,
+            method=snapshot.method or method,
+        )
+    return Response(content=_WAIT_RESPONSE_ADAPTER.dump_json(result), media_type="application/json")
 
 
 def _serialize_snapshot(snapshot: ProvisionedDeviceSnapshot) -> ProvisionedDeviceModel:
-    return ProvisionedDeviceModel(
+    return ProvisionedDeviceModel.model_construct(
         id=snapshot.id,
         topic=snapshot.topic,
         online=snapshot.online,
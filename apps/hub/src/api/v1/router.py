@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 
+from api.responses import PydanticJSONResponse
 from config import settings
 from .auth_router import router as auth_router
 from .device_registry_router import router as device_registry_router
@@ -15,7 +16,7 @@ from .provision_router import router as provision_router
 from .events_router import router as events_router
 from .managed_router import router as managed_router
 
-router = APIRouter(prefix="/api/v1", tags=["v1"])
+router = APIRouter(prefix="/api/v1", tags=["v1"], default_response_class=PydanticJSONResponse)
 router.include_router(auth_router)
 router.include_router(device_registry_router)
 router.include_router(mock_router)
@@ -31,11 +32,6 @@ router.include_router(events_router)
 router.include_router(managed_router)
 
 
-@router.get("/health")
-async def health():
-    return {"status": "ok", "version": settings.app_version}
-
-
 @router.get("/info")
 async def info():
     return {
@@ -1,16 +1,15 @@
 from __future__ import annotations
 
-import csv
-import gzip
-import io
-from typing import Iterable, Iterator
+import zlib
+from operator import attrgetter
+from typing import Iterable, Iterator, Sequence
 
 from config import settings
 from fastapi import APIRouter, Query
 from fastapi.responses import StreamingResponse
 
 from services.telemetry import telemetry_store
-from services.plant_telemetry import plant_telemetry_store
+from services.plant_telemetry import PotTelemetryRow, plant_telemetry_store
 
 
 MIN_LOOKBACK_HOURS = 1.0 / 60.0  # one minute
@@ -36,6 +35,31 @@ CSV_FIELDNAMES = [
     "source",
     "requestId",
 ]
+_CSV_FIELDS = tuple(CSV_FIELDNAMES)
+# PotTelemetryRow attributes in CSV_FIELDNAMES order.
+_CSV_ROW_VALUES = attrgetter(
+    "pot_id",
+    "timestamp_iso",
+    "timestamp_ms",
+    "moisture",
+    "temperature",
+    "humidity",
+    "pressure",
+    "solar",
+    "wind",
+    "valve_open",
+    "fan_on",
+    "mister_on",
+    "light_on",
+    "flow_rate",
+    "water_low",
+    "water_cutoff",
+    "soil_raw",
+    "source",
+    "request_id",
+)
+_CSV_HEADER_BYTES = (",".join(_CSV_FIELDS) + "\r\n").encode("utf-8")
+CSV_ROWS_PER_CHUNK = 256
 
 
 router = APIRouter(prefix="/telemetry", tags=["telemetry"])
@@ -102,13 +126,13 @@ async def export_pot_telemetry(
         description="Set to true to stream gzip-compressed CSV",
     ),
 ) -> StreamingResponse:
-    normalized, samples = await _fetch_pot_samples(
+    normalized, rows = await _fetch_pot_rows(
         pot_id,
         hours=hours,
         limit=limit if limit is not None else MAX_POT_SAMPLES,
     )
     filename_root = (normalized or pot_id or "pot") + "-telemetry"
-    csv_stream = _iter_csv_bytes(samples)
+    csv_stream = _iter_csv_bytes(map(_CSV_ROW_VALUES, rows))
     media_type = "text/csv"
     headers = {"Content-Disposition": f'attachment; filename="{filename_root}.csv"'}
     if gzip_output:
@@ -129,36 +153,51 @@ async def _fetch_pot_samples(pot_id: str, *, hours: float, limit: int):
     return normalized, samples
 
 
-def _iter_csv_bytes(samples: Iterable[dict]) -> Iterator[bytes]:
-    buffer = io.StringIO()
-    writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDNAMES, extrasaction="ignore")
-    writer.writeheader()
-    yield buffer.getvalue().encode("utf-8")
-    buffer.seek(0)
-    buffer.truncate(0)
-    for sample in samples:
-        writer.writerow({field: sample.get(field) for field in CSV_FIELDNAMES})
-        yield buffer.getvalue().encode("utf-8")
-        buffer.seek(0)
-        buffer.truncate(0)
+async def _fetch_pot_rows(pot_id: str, *, hours: float, limit: int) -> tuple[str, list[PotTelemetryRow]]:
+    normalized = pot_id.strip().lower()
+    if not normalized:
+        return normalized, []
+    rows = await plant_telemetry_store.list_rows(normalized, hours=hours, limit=limit)
+    return normalized, rows
+
+
+def _csv_escape(value: object) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (int, float)):
+        return str(value)
+    text = value if isinstance(value, str) else str(value)
+    if '"' in text:
+        return '"' + text.replace('"', '""') + '"'
+    if "," in text or "\n" in text or "\r" in text:
+        return '"' + text + '"'
+    return text
+
+
+def _iter_csv_bytes(rows: Iterable[Sequence[object]]) -> Iterator[bytes]:
+    # ``rows`` yields value tuples in CSV_FIELDNAMES order. Output matches
+    # csv.DictWriter's excel dialect (minimal quoting, CRLF rows) while
+    # batching rows into larger chunks instead of one StringIO round-trip each.
+    yield _CSV_HEADER_BYTES
+    lines: list[str] = []
+    for values in rows:
+        lines.append(",".join(map(_csv_escape, values)) + "\r\n")
+        if len(lines) >= CSV_ROWS_PER_CHUNK:
+            yield "".join(lines).encode("utf-8")
+            lines.clear()
+    if lines:
+        yield "".join(lines).encode("utf-8")
 
 
 def _gzip_stream(source: Iterable[bytes]) -> Iterator[bytes]:
-    buffer = io.BytesIO()
-    gzip_file = gzip.GzipFile(fileobj=buffer, mode="wb")
-    try:
-        for chunk in source:
-            if not chunk:
-                continue
-            gzip_file.write(chunk)
-            gzip_file.flush()
-            data = buffer.getvalue()
-            if data:
-                yield data
-                buffer.seek(0)
-                buffer.truncate(0)
-    finally:
-        gzip_file.close()
-        remaining = buffer.getvalue()
-        if remaining:
-            yield remaining
+    # wbits=31 selects gzip framing, so no GzipFile/BytesIO wrapper is needed.
+    compressor = zlib.compressobj(level=6, wbits=31)
+    for chunk in source:
+        if not chunk:
+            continue
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    tail = compressor.flush(zlib.Z_FINISH)
+    if tail:
+        yield tail
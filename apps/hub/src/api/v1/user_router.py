@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from pydantic import BaseModel, EmailStr, Field
+from pydantic_core import to_json
 
 from services.plants import (
     CatalogError,
     CatalogNotFoundError,
+    CatalogPermissionError,
     ShareRecord,
     ShareRole,
     ShareStatus,
@@ -83,13 +86,28 @@ class UserPreferencesUpdateRequest(BaseModel):
     replace: bool = False
 
 
-@router.get("", response_model=list[UserModel])
-async def list_users() -> list[UserModel]:
-    return [_to_user_model(user) for user in plant_catalog.list_users()]
+_JSON_CACHE_SIZE = 4096
+_PAGE_CACHE_SIZE = 256
+USER_PAGE_LIMIT = 100
+MAX_USER_PAGE_LIMIT = 500
+SHARE_PAGE_LIMIT = 100
+MAX_SHARE_PAGE_LIMIT = 500
 
 
-@router.post("", response_model=UserModel, status_code=status.HTTP_201_CREATED)
-async def create_user(payload: UserCreateRequest) -> UserModel:
+@router.get("", responses={200: {"model": list[UserModel]}})
+async def list_users(
+    after: str | None = Query(default=None, description="Return users whose id sorts after this cursor"),
+    limit: int | None = Query(default=None, ge=1, le=MAX_USER_PAGE_LIMIT, description="Maximum users to return"),
+) -> Response:
+    # Without pagination parameters the full list is returned, as before.
+    if after is None and limit is None:
+        return _json_bytes_response(_encode_user_list(plant_catalog.users_version))
+    page_limit = limit if limit is not None else USER_PAGE_LIMIT
+    return _json_bytes_response(_encode_users_page(after, page_limit, plant_catalog.users_version))
+
+
+@router.post("", status_code=status.HTTP_201_CREATED, responses={201: {"model": UserModel}})
+async def create_user(payload: UserCreateRequest) -> Response:
     if payload.password != payload.confirm_password:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Passwords do not match")
     try:
@@ -101,54 +119,53 @@ async def create_user(payload: UserCreateRequest) -> UserModel:
         )
     except CatalogError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
-    return _to_user_model(user)
+    return _json_bytes_response(_user_json(user), status_code=status.HTTP_201_CREATED)
 
 
-@router.get("/me", response_model=UserModel)
-async def get_me(current_user: UserAccount = Depends(get_current_user)) -> UserModel:
-    return _to_user_model(current_user)
+@router.get("/me", responses={200: {"model": UserModel}})
+async def get_me(current_user: UserAccount = Depends(get_current_user)) -> Response:
+    return _json_bytes_response(_user_json(current_user))
 
 
-@router.get("/me/preferences", response_model=UserPreferencesModel)
-async def get_my_preferences(current_user: UserAccount = Depends(get_current_user)) -> UserPreferencesModel:
-    values = plant_catalog.get_user_preferences(current_user.id)
-    return UserPreferencesModel(values=values)
+@router.get("/me/preferences", responses={200: {"model": UserPreferencesModel}})
+async def get_my_preferences(current_user: UserAccount = Depends(get_current_user)) -> Response:
+    return _json_bytes_response(_encode_preferences(current_user.id, plant_catalog.users_version))
 
 
-@router.put("/me/preferences", response_model=UserPreferencesModel)
+@router.put("/me/preferences", responses={200: {"model": UserPreferencesModel}})
 async def update_my_preferences(
     payload: UserPreferencesUpdateRequest,
     current_user: UserAccount = Depends(get_current_user),
-) -> UserPreferencesModel:
+) -> Response:
     values = plant_catalog.update_user_preferences(current_user.id, payload.values, replace=payload.replace)
-    return UserPreferencesModel(values=values)
+    return _json_bytes_response(_preferences_json(values))
 
 
-@router.get("/{user_id}", response_model=UserModel)
-async def get_user(user_id: str) -> UserModel:
-    user = plant_catalog.get_user(user_id)
-    if user is None:
+@router.get("/{user_id}", responses={200: {"model": UserModel}})
+async def get_user(user_id: str) -> Response:
+    body = _encode_user_by_id(user_id, plant_catalog.users_version)
+    if body is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
-    return _to_user_model(user)
+    return _json_bytes_response(body)
 
 
-@router.post("/{user_id}/verify", response_model=UserModel)
-async def verify_user_account(user_id: str, payload: UserVerifyRequest) -> UserModel:
+@router.post("/{user_id}/verify", responses={200: {"model": UserModel}})
+async def verify_user_account(user_id: str, payload: UserVerifyRequest) -> Response:
     try:
         user = plant_catalog.verify_user(user_id, payload.token)
     except CatalogNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     except CatalogError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
-    return _to_user_model(user)
+    return _json_bytes_response(_user_json(user))
 
 
-@router.patch("/{user_id}", response_model=UserModel)
+@router.patch("/{user_id}", responses={200: {"model": UserModel}})
 async def update_user(
     user_id: str,
     payload: UserUpdateRequest,
     current_user: UserAccount = Depends(get_current_user),
-) -> UserModel:
+) -> Response:
     if current_user.id != user_id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Cannot update other users")
 
@@ -167,7 +184,7 @@ async def update_user(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     except CatalogError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
-    return _to_user_model(updated)
+    return _json_bytes_response(_user_json(updated))
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -182,21 +199,25 @@ async def delete_user(user_id: str, current_user: UserAccount = Depends(get_curr
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
 
 
-@router.get("/me/shares", response_model=list[ShareModel])
-async def list_my_shares(current_user: UserAccount = Depends(get_current_user)) -> list[ShareModel]:
-    shares = plant_catalog.list_shares(current_user.id)
-    return [_to_share_model(share, current_user.id) for share in shares]
+@router.get("/me/shares", responses={200: {"model": list[ShareModel]}})
+async def list_my_shares(
+    after: str | None = Query(default=None, description="Return shares whose id sorts after this cursor"),
+    limit: int | None = Query(default=None, ge=1, le=MAX_SHARE_PAGE_LIMIT, description="Maximum shares to return"),
+    current_user: UserAccount = Depends(get_current_user),
+) -> Response:
+    if after is None and limit is None:
+        return _json_bytes_response(_encode_share_list(current_user.id, plant_catalog.version))
+    page_limit = limit if limit is not None else SHARE_PAGE_LIMIT
+    return _json_bytes_response(_encode_share_page(current_user.id, after, page_limit, plant_catalog.version))
 
 
-@router.post("/me/shares", response_model=ShareModel, status_code=status.HTTP_201_CREATED)
+@router.post("/me/shares", status_code=status.HTTP_201_CREATED, responses={201: {"model": ShareModel}})
 async def create_share(
     payload: ShareCreateRequest,
     current_user: UserAccount = Depends(get_current_user),
-) -> ShareModel:
+) -> Response:
     if current_user.id == payload.contractor_id:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cannot share with yourself")
-    if plant_catalog.get_user(payload.contractor_id) is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contractor user not found")
     try:
         share = plant_catalog.add_share(
             owner_id=current_user.id,
@@ -205,69 +226,177 @@ async def create_share(
             status=payload.status,
             invite_token=payload.invite_token,
         )
+    except CatalogNotFoundError as exc:
+        # add_share resolves both participants; only look again to pick the error.
+        if plant_catalog.get_user(payload.contractor_id) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Contractor user not found") from exc
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     except CatalogError as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
-    return _to_share_model(share, current_user.id)
+    return _json_bytes_response(_share_json(share, current_user.id), status_code=status.HTTP_201_CREATED)
 
 
-@router.patch("/me/shares/{share_id}", response_model=ShareModel)
+@router.patch("/me/shares/{share_id}", responses={200: {"model": ShareModel}})
 async def update_share(
     share_id: str,
     payload: ShareUpdateRequest,
     current_user: UserAccount = Depends(get_current_user),
-) -> ShareModel:
-    share = plant_catalog.get_share(share_id)
-    if share is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Share not found")
-    if share.owner_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only owners can update shares")
+) -> Response:
     try:
         updated = plant_catalog.update_share(
             share_id,
             status=payload.status,
             role=payload.role,
+            acting_user_id=current_user.id,
         )
     except CatalogNotFoundError as exc:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
-    return _to_share_model(updated, current_user.id)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Share not found") from exc
+    except CatalogPermissionError as exc:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
+    return _json_bytes_response(_share_json(updated, current_user.id))
 
 
 @router.delete("/me/shares/{share_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_share(share_id: str, current_user: UserAccount = Depends(get_current_user)) -> None:
-    share = plant_catalog.get_share(share_id)
-    if share is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Share not found")
-    if share.owner_id != current_user.id:
-        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Only owners can delete shares")
-    plant_catalog.remove_share(share_id)
-
-
-def _to_user_model(user: UserAccount) -> UserModel:
-    return UserModel(
-        id=user.id,
-        email=user.email,
-        display_name=user.display_name,
-        email_verified=user.email_verified,
-        verification_pending=not user.email_verified,
-        auth_provider=user.auth_provider,
-        avatar_url=user.avatar_url,
-        created_at=user.created_at,
-        updated_at=user.updated_at,
+    try:
+        plant_catalog.remove_share(share_id, acting_user_id=current_user.id)
+    except CatalogNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Share not found") from exc
+    except CatalogPermissionError as exc:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
+
+
+def _json_bytes_response(body: bytes, *, status_code: int = status.HTTP_200_OK) -> Response:
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+
+def _json_array(items: list[bytes]) -> bytes:
+    return b"[" + b",".join(items) + b"]"
+
+
+@lru_cache(maxsize=_JSON_CACHE_SIZE)
+def _encode_user_by_id(user_id: str, users_version: int) -> bytes | None:
+    # Profile lookups hit this directly; a miss (None) is cached until the next account change.
+    user = plant_catalog.get_user(user_id)
+    return None if user is None else _user_json(user)
+
+
+@lru_cache(maxsize=_PAGE_CACHE_SIZE)
+def _encode_user_list(users_version: int) -> bytes:
+    return _json_array([_user_json(user) for user in plant_catalog.list_users()])
+
+
+@lru_cache(maxsize=_PAGE_CACHE_SIZE)
+def _encode_users_page(after: str | None, limit: int, users_version: int) -> bytes:
+    # users_version only keys the cache; any account change starts a new entry.
+    return _json_array([_user_json(user) for user in plant_catalog.list_users_page(after=after, limit=limit)])
+
+
+@lru_cache(maxsize=_PAGE_CACHE_SIZE)
+def _encode_preferences(user_id: str, users_version: int) -> bytes:
+    # Preference writes bump users_version, so a hit is never stale.
+    return _preferences_json(plant_catalog.get_user_preferences(user_id))
+
+
+def _preferences_json(values: dict[str, object]) -> bytes:
+    # Values arrived as JSON, so they encode without a schema walk.
+    return to_json({"values": values}, inf_nan_mode="null")
+
+
+@lru_cache(maxsize=_PAGE_CACHE_SIZE)
+def _encode_share_list(viewer_id: str, version: int) -> bytes:
+    # The catalog version bumps on every share change.
+    return _json_array([_share_json(share, viewer_id) for share in plant_catalog.list_shares(viewer_id)])
+
+
+@lru_cache(maxsize=_PAGE_CACHE_SIZE)
+def _encode_share_page(viewer_id: str, after: str | None, limit: int, version: int) -> bytes:
+    shares = plant_catalog.list_shares_page(viewer_id, after=after, limit=limit)
+    return _json_array([_share_json(share, viewer_id) for share in shares])
+
+
+def _user_json(user: UserAccount) -> bytes:
+    # The cache key is every serialized field, so edits to the account miss
+    # naturally and no invalidation hooks are needed on the write paths.
+    return _encode_user(
+        user.id,
+        user.email,
+        user.display_name,
+        user.email_verified,
+        user.auth_provider,
+        user.avatar_url,
+        user.created_at,
+        user.updated_at,
+    )
+
+
+@lru_cache(maxsize=_JSON_CACHE_SIZE)
+def _encode_user(
+    user_id: str,
+    email: str,
+    display_name: str,
+    email_verified: bool,
+    auth_provider: str,
+    avatar_url: str | None,
+    created_at: float,
+    updated_at: float,
+) -> bytes:
+    # Keys follow UserModel field order so the bytes match a model dump.
+    return to_json(
+        {
+            "id": user_id,
+            "email": email,
+            "display_name": display_name,
+            "email_verified": email_verified,
+            "verification_pending": not email_verified,
+            "auth_provider": auth_provider,
+            "avatar_url": avatar_url,
+            "created_at": created_at,
+            "updated_at": updated_at,
+        }
     )
 
 
-def _to_share_model(share: ShareRecord, viewer_id: str) -> ShareModel:
-    participant_role: Literal["owner", "contractor"] = "owner" if share.owner_id == viewer_id else "contractor"
-    return ShareModel(
-        id=share.id,
-        owner_id=share.owner_id,
-        contractor_id=share.contractor_id,
-        role=share.role,
-        status=share.status,
-        invite_token=share.invite_token,
-        created_at=share.created_at,
-        updated_at=share.updated_at,
-        participant_role=participant_role,
+def _share_json(share: ShareRecord, viewer_id: str) -> bytes:
+    return _encode_share(
+        share.id,
+        share.owner_id,
+        share.contractor_id,
+        # Plain strings encode far faster than str-Enum members in to_json.
+        share.role.value,
+        share.status.value,
+        share.invite_token,
+        share.created_at,
+        share.updated_at,
+        share.owner_id == viewer_id,
+    )
+
+
+@lru_cache(maxsize=_JSON_CACHE_SIZE)
+def _encode_share(
+    share_id: str,
+    owner_id: str,
+    contractor_id: str,
+    role: str,
+    share_status: str,
+    invite_token: str | None,
+    created_at: float,
+    updated_at: float,
+    viewer_is_owner: bool,
+) -> bytes:
+    # Keys follow ShareModel field order so the bytes match a model dump.
+    return to_json(
+        {
+            "id": share_id,
+            "owner_id": owner_id,
+            "contractor_id": contractor_id,
+            "role": role,
+            "status": share_status,
+            "invite_token": invite_token,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "participant_role": "owner" if viewer_is_owner else "contractor",
+        }
     )
 
 
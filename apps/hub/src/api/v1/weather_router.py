@@ -1,17 +1,24 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import os
 import re
 import shutil
+import time
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Literal, Optional
+from typing import Any, Callable, Iterable, Iterator, Literal, Optional
 
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import BaseModel, Field, TypeAdapter
 
 from config import settings
 from services.weather import weather_service
@@ -20,17 +27,53 @@ from services.weather_hrrr import (
 	HrrrDependencyError,
 	HrrrSample,
 	hrrr_weather_service,
+	iter_cache_files,
 )
 
 router = APIRouter(prefix="/weather", tags=["weather"])
 
 ALLOWED_WINDOWS = [0, 0.5, 1, 2, 6, 12, 24, 48, 72]
+_ALLOWED_WINDOW_SET = frozenset(ALLOWED_WINDOWS)
+# Shared by every WeatherResponse; a tuple so constructed responses cannot mutate it.
+_AVAILABLE_WINDOWS = tuple(ALLOWED_WINDOWS)
 MAX_HRRR_HISTORY_HOURS = 48
+HRRR_HISTORY_CONCURRENCY = 8
+SNAPSHOT_CACHE_SIZE = 256
+_SNAPSHOT_CACHE: OrderedDict[tuple[int, float, float, bool | None], tuple[HrrrSample, HrrrSnapshot]] = OrderedDict()
+HISTORY_SAMPLE_CACHE_SIZE = 1024
+HISTORY_SAMPLE_TTL_SECONDS = 900.0
+HISTORY_MISS_TTL_SECONDS = 60.0
+# (lat, lon, valid hour) -> (monotonic expiry, sample or unavailable reason) for
+# past-hour HRRR lookups; misses are remembered briefly so a burst of requests
+# does not re-fetch a dead hour, but a late-arriving file is picked up soon.
+_HISTORY_SAMPLES: OrderedDict[tuple[float, float, str], tuple[float, HrrrSample | str]] = OrderedDict()
+HRRR_STATUS_TTL_SECONDS = 5.0
+# history limit -> (monotonic expiry, serialized response) for back-to-back status polls.
+_STATUS_CACHE: dict[int, tuple[float, bytes]] = {}
+_STATUS_LOCK = asyncio.Lock()
 SOLAR_W_TO_MJ = 0.0036
+_MIN_UTC = datetime.min.replace(tzinfo=timezone.utc)
+# (W/m2 attribute, MJ/m2/h field) pairs shared by the HRRR sample and response models.
+_SOLAR_COMPONENTS = tuple(
+	(f"solar_radiation{suffix}_w_m2", f"solar_radiation{suffix}_mj_m2_h")
+	for suffix in ("", "_diffuse", "_direct", "_clear", "_clear_up")
+)
+# WeatherTelemetry carries no clear-sky upwelling component.
+_TELEMETRY_SOLAR_COMPONENTS = _SOLAR_COMPONENTS[:4]
+# Fetch a sample's W/m2 attributes as a tuple in component order.
+_SOLAR_W_VALUES = attrgetter(*(w_name for w_name, _ in _SOLAR_COMPONENTS))
+_TELEMETRY_SOLAR_W_VALUES = attrgetter(*(w_name for w_name, _ in _TELEMETRY_SOLAR_COMPONENTS))
 CACHE_ENTRY_ORDERS = {"newest", "oldest", "largest", "smallest"}
+CACHE_MUTATION_WORKERS = 4
 CACHE_ENTRY_KINDS = {"grib", "metadata", "log", "other"}
+# Final extension -> kind; ".grib2.json" sidecars fall under ".json".
+_CACHE_KIND_BY_SUFFIX = {".grib2": "grib", ".json": "metadata", ".jsonl": "log"}
 STATION_FALLBACK_MAX_HOURS = 1.0
 STATION_FALLBACK_MIN_HOURS = 0.5
+# Cache layout: hrrr.YYYYMMDD/<domain>/hrrr.tHHz.wrfsfcfFF.grib2
+_CACHE_DATE_RE = re.compile(r"hrrr\.(\d{8})")
+_CACHE_RUN_RE = re.compile(r"hrrr\.t(\d{2})z\.wrfsfcf(\d{2})")
+_LABEL_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_-]+")
 STATION_OVERRIDES: dict[str, dict[str, object]] = {
 	"KDCA": {
 		"name": "Ronald Reagan National",
@@ -63,6 +106,11 @@ TESTING_STATION_FIXTURE = {
 }
 
 
+def require_hrrr() -> None:
+	if not settings.hrrr_enabled:
+		raise HTTPException(status_code=404, detail="HRRR integration is disabled")
+
+
 def validate_lat(lat: float = Query(..., ge=-90.0, le=90.0)) -> float:
 	return lat
 
@@ -72,7 +120,7 @@ def validate_lon(lon: float = Query(..., ge=-180.0, le=180.0)) -> float:
 
 
 def validate_hours(hours: float = Query(6.0, description="Lookback window in hours")) -> float:
-	if hours not in ALLOWED_WINDOWS:
+	if hours not in _ALLOWED_WINDOW_SET:
 		raise HTTPException(status_code=400, detail="Unsupported hours window")
 	return hours
 
@@ -98,6 +146,9 @@ class WeatherTelemetry(BaseModel):
 	source: str | None = Field(default=None, description="Comma-delimited data sources contributing to this record")
 
 
+_TELEMETRY_LIST_ADAPTER = TypeAdapter(list[WeatherTelemetry])
+
+
 class WeatherStation(BaseModel):
 	id: str | None = None
 	name: str | None = None
@@ -111,7 +162,7 @@ class WeatherResponse(BaseModel):
 	location: dict[str, float]
 	requested_hours: float
 	coverage_hours: float
-	available_windows: list[float]
+	available_windows: tuple[float, ...]
 	data: list[WeatherTelemetry]
 	station: WeatherStation | None = None
 	sources: list[str] = Field(default_factory=list, description="Unique data providers contributing to this series")
@@ -122,6 +173,11 @@ class WeatherResponse(BaseModel):
 	)
 
 
+# The response is assembled from constructed HRRR models and already-validated
+# station telemetry, so /local dumps it once instead of revalidating a dict.
+_WEATHER_RESPONSE_ADAPTER = TypeAdapter(WeatherResponse)
+
+
 class HrrrRunInfo(BaseModel):
 	cycle: str
 	forecast_hour: int
@@ -186,6 +242,10 @@ class HrrrStatusResponse(BaseModel):
 	recent_fetches: list[HrrrFetchStatusModel] = Field(default_factory=list)
 
 
+_STATUS_RESPONSE_ADAPTER = TypeAdapter(HrrrStatusResponse)
+_FETCH_LOG_ADAPTER = TypeAdapter(list[HrrrFetchStatusModel])
+
+
 class HrrrScheduleRequest(BaseModel):
 	interval_minutes: Literal[15, 60] = Field(
 		...,
@@ -263,12 +323,17 @@ class CacheStoreRequest(CacheMutationRequest):
 	)
 
 
-@router.get("/local", response_model=WeatherResponse)
+@router.get("/local", responses={200: {"model": WeatherResponse}})
 async def get_local_weather(
 	lat: float = Depends(validate_lat),
 	lon: float = Depends(validate_lon),
 	hours: float = Depends(validate_hours),
-):
+) -> Response:
+	response = await _load_local_weather(lat, lon, hours)
+	return _json_bytes_response(_WEATHER_RESPONSE_ADAPTER.dump_json(response))
+
+
+async def _load_local_weather(lat: float, lon: float, hours: float) -> WeatherResponse:
 	if not settings.hrrr_enabled:
 		return await _build_station_weather_response(
 			lat,
@@ -307,34 +372,34 @@ async def get_local_weather(
 		raise HTTPException(status_code=502, detail=f"Failed to load HRRR data: {exc}") from exc
 
 
-@router.get("/hrrr/status", response_model=HrrrStatusResponse)
-async def get_hrrr_status(history: int = Query(10, ge=1, le=200)):
-	return await _build_hrrr_status_response(history_limit=history)
+@router.get("/hrrr/status", responses={200: {"model": HrrrStatusResponse}})
+async def get_hrrr_status(history: int = Query(10, ge=1, le=200)) -> Response:
+	return _json_bytes_response(await _cached_hrrr_status_json(history_limit=history))
 
 
-@router.post("/hrrr/schedule", response_model=HrrrStatusResponse)
-async def update_hrrr_schedule(payload: HrrrScheduleRequest):
-	_ensure_hrrr_enabled()
+@router.post("/hrrr/schedule", responses={200: {"model": HrrrStatusResponse}}, dependencies=[Depends(require_hrrr)])
+async def update_hrrr_schedule(payload: HrrrScheduleRequest) -> Response:
 	try:
 		await hrrr_weather_service.select_refresh_minutes(float(payload.interval_minutes))
 	except ValueError as exc:
 		raise HTTPException(status_code=400, detail=str(exc))
-	return await _build_hrrr_status_response(history_limit=10)
+	_STATUS_CACHE.clear()
+	response = await _build_hrrr_status_response(history_limit=10)
+	return _json_bytes_response(_STATUS_RESPONSE_ADAPTER.dump_json(response))
 
 
-@router.get("/hrrr/fetch-log", response_model=list[HrrrFetchStatusModel])
-async def get_hrrr_fetch_log(limit: int = Query(20, ge=1, le=200)):
-	_ensure_hrrr_enabled()
+@router.get("/hrrr/fetch-log", responses={200: {"model": list[HrrrFetchStatusModel]}}, dependencies=[Depends(require_hrrr)])
+async def get_hrrr_fetch_log(limit: int = Query(20, ge=1, le=200)) -> Response:
 	history = await hrrr_weather_service.fetch_history(limit=limit)
-	return [HrrrFetchStatusModel(**entry) for entry in history]
+	entries = [HrrrFetchStatusModel.model_construct(**entry) for entry in history]
+	return _json_bytes_response(_FETCH_LOG_ADAPTER.dump_json(entries))
 
 
-@router.get("/hrrr/health", response_model=HrrrHealthResponse)
+@router.get("/hrrr/health", response_model=HrrrHealthResponse, dependencies=[Depends(require_hrrr)])
 async def get_hrrr_health():
-	_ensure_hrrr_enabled()
 	status_payload = await hrrr_weather_service.status(history_limit=1)
 	recent_fetches_payload = status_payload.get("recent_fetches", [])
-	recent_fetch = HrrrFetchStatusModel(**recent_fetches_payload[-1]) if recent_fetches_payload else None
+	recent_fetch = HrrrFetchStatusModel.model_construct(**recent_fetches_payload[-1]) if recent_fetches_payload else None
 	last_refresh_iso = status_payload.get("last_refresh")
 	last_valid_iso = status_payload.get("last_valid_time")
 	last_refresh_dt = _parse_iso_timestamp(last_refresh_iso)
@@ -360,7 +425,7 @@ async def get_hrrr_health():
 	elif recent_fetch is not None and recent_fetch.status != "success":
 		message = f"Most recent fetch reported {recent_fetch.status}"
 		ok = False
-	return HrrrHealthResponse(
+	return HrrrHealthResponse.model_construct(
 		enabled=enabled,
 		scheduler_running=scheduler_running,
 		stale=stale,
@@ -373,42 +438,40 @@ async def get_hrrr_health():
 	)
 
 
-@router.get("/hrrr/cache", response_model=CacheEntriesResponse)
+@router.get("/hrrr/cache", response_model=CacheEntriesResponse, dependencies=[Depends(require_hrrr)])
 async def inspect_hrrr_cache(
 	order: Literal["newest", "oldest", "largest", "smallest"] = Query("newest"),
 	limit: int = Query(100, ge=1, le=500),
 ):
-	_ensure_hrrr_enabled()
 	cache_dir = Path(settings.hrrr_cache_dir)
 	payload = await asyncio.to_thread(_collect_cache_entries, cache_dir, order, limit)
 	return CacheEntriesResponse(**payload)
 
 
-@router.post("/hrrr/cache/delete", response_model=CacheDeletionResponse)
+@router.post("/hrrr/cache/delete", response_model=CacheDeletionResponse, dependencies=[Depends(require_hrrr)])
 async def delete_hrrr_cache_entries(payload: CacheMutationRequest):
-	_ensure_hrrr_enabled()
 	cache_dir = Path(settings.hrrr_cache_dir)
 	result = await asyncio.to_thread(_delete_cache_entries, cache_dir, payload)
+	_STATUS_CACHE.clear()
 	return CacheDeletionResponse(**result)
 
 
-@router.post("/hrrr/cache/store", response_model=CacheStoreResponse)
+@router.post("/hrrr/cache/store", response_model=CacheStoreResponse, dependencies=[Depends(require_hrrr)])
 async def store_hrrr_cache_entries(payload: CacheStoreRequest):
-	_ensure_hrrr_enabled()
 	cache_dir = Path(settings.hrrr_cache_dir)
 	archive_dir = Path(settings.hrrr_archive_dir)
 	result = await asyncio.to_thread(_store_cache_entries, cache_dir, archive_dir, payload)
+	_STATUS_CACHE.clear()
 	return CacheStoreResponse(**result)
 
 
-@router.get("/hrrr/point", response_model=HrrrSnapshot)
+@router.get("/hrrr/point", response_model=HrrrSnapshot, dependencies=[Depends(require_hrrr)])
 async def get_hrrr_point(
 	lat: float = Depends(validate_lat),
 	lon: float = Depends(validate_lon),
 	refresh: bool = Query(True, description="Force downloading the latest HRRR run for the point"),
 	persist: bool = Query(True, description="Persist the refreshed sample into the telemetry store"),
 ):
-	_ensure_hrrr_enabled()
 	sample: HrrrSample | None = None
 	persisted_flag: bool | None = None
 	if not refresh:
@@ -426,13 +489,12 @@ async def get_hrrr_point(
 	return _marshal_hrrr_sample(lat, lon, sample, persisted=persisted_flag)
 
 
-@router.post("/hrrr/refresh", response_model=HrrrSnapshot)
+@router.post("/hrrr/refresh", response_model=HrrrSnapshot, dependencies=[Depends(require_hrrr)])
 async def refresh_hrrr_point(
 	lat: float | None = Query(default=None, ge=-90.0, le=90.0),
 	lon: float | None = Query(default=None, ge=-180.0, le=180.0),
 	persist: bool = Query(True, description="Persist the refreshed sample into the telemetry store"),
 ):
-	_ensure_hrrr_enabled()
 	target_lat = lat if lat is not None else settings.hrrr_default_lat
 	target_lon = lon if lon is not None else settings.hrrr_default_lon
 	if target_lat is None or target_lon is None:
@@ -445,6 +507,7 @@ async def refresh_hrrr_point(
 		raise HTTPException(status_code=503, detail=str(exc))
 	except Exception as exc:  # pragma: no cover - defensive logging
 		raise HTTPException(status_code=502, detail=f"Failed to refresh HRRR data: {exc}") from exc
+	_STATUS_CACHE.clear()
 	return _marshal_hrrr_sample(target_lat, target_lon, sample, persisted=persist)
 
 
@@ -458,38 +521,44 @@ async def _collect_hrrr_series(
 	target_hours = MAX_HRRR_HISTORY_HOURS
 	series: dict[str, WeatherTelemetry] = {}
 	errors: list[str] = []
+	semaphore = asyncio.Semaphore(HRRR_HISTORY_CONCURRENCY)
 
-	async def _fetch_for(timestamp: datetime, *, reuse_seed: bool) -> bool:
+	async def _fetch_for(timestamp: datetime) -> HrrrSample | str:
 		try:
-			if reuse_seed:
-				sample = seed_sample
-			else:
-				sample = await hrrr_weather_service.refresh_point(
-					lat,
-					lon,
-					when=timestamp,
-					persist=False,
-				)
-			entry = _telemetry_from_hrrr(sample)
-			if entry.timestamp:
-				series[entry.timestamp] = entry
-				return True
+			async with semaphore:
+				return await _historical_sample(lat, lon, timestamp)
 		except (HrrrDependencyError, HrrrDataUnavailable) as exc:
-			errors.append(str(exc))
+			return str(exc)
 		except Exception as exc:  # pragma: no cover - defensive logging
-			errors.append(str(exc))
-		return False
+			return str(exc)
 
 	reference = seed_sample.run.valid_time.replace(minute=0, second=0, microsecond=0)
-	for offset in range(target_hours):
-		target = reference - timedelta(hours=offset)
-		target_iso = _format_timestamp(target)
-		if target_iso in series and offset != 0:
-			continue
-		if not await _fetch_for(target, reuse_seed=offset == 0):
+	targets = [reference - timedelta(hours=offset) for offset in range(target_hours)]
+	# Fetch the historical hours concurrently (downloads are deduplicated per
+	# GRIB file by the service), then merge in offset order so the result
+	# matches the old sequential walk: an hour already covered by an earlier
+	# entry is skipped along with any error it produced.
+	results = await asyncio.gather(*(_fetch_for(target) for target in targets[1:]))
+	# Valid hours already in ``series``, compared as datetimes so skipped
+	# targets are never formatted; entries are only built for kept samples.
+	covered: set[datetime] = set()
+
+	def _add(sample: HrrrSample) -> None:
+		entry = _telemetry_from_hrrr(sample)
+		if entry.timestamp:
+			series[entry.timestamp] = entry
+			covered.add(sample.run.valid_time.replace(microsecond=0))
+
+	_add(seed_sample)
+	for target, result in zip(targets[1:], results):
+		if target in covered:
 			continue
+		if isinstance(result, str):
+			errors.append(result)
+		else:
+			_add(result)
 
-	entries = sorted(series.values(), key=lambda entry: _parse_iso_timestamp(entry.timestamp) or datetime.min)
+	entries = sorted(series.values(), key=_telemetry_sort_key)
 	error_message = None
 	if errors:
 		unique_errors = sorted(set(errors))
@@ -497,6 +566,48 @@ async def _collect_hrrr_series(
 	return entries, error_message
 
 
+def _telemetry_sort_key(entry: WeatherTelemetry) -> datetime:
+	# sorted() evaluates this once per entry and _parse_iso_utc memoizes the
+	# parse. Unparseable values sort first against an aware minimum, since a
+	# naive datetime.min cannot be compared with the parsed UTC values.
+	return _parse_iso_timestamp(entry.timestamp) or _MIN_UTC
+
+
+async def _historical_sample(lat: float, lon: float, when: datetime) -> HrrrSample:
+	"""Return the HRRR sample for a past hour, reusing recent lookups.
+
+	Overlapping /weather/local requests walk the same 48 hours; a past hour's
+	sample does not change within a cycle, so it is kept for
+	``HISTORY_SAMPLE_TTL_SECONDS`` instead of re-decoding the GRIB each time.
+	Hours the service reports as unavailable (typically outside the NOMADS
+	retention window) are remembered for ``HISTORY_MISS_TTL_SECONDS`` and
+	re-raised, so a file the service downloads later is not hidden for long.
+	Coordinates are rounded like the service's own per-point cache.
+	"""
+	key = (round(lat, 4), round(lon, 4), _format_timestamp(when))
+	cached = _HISTORY_SAMPLES.get(key)
+	if cached is not None and cached[0] > time.monotonic():
+		_HISTORY_SAMPLES.move_to_end(key)
+		if isinstance(cached[1], str):
+			raise HrrrDataUnavailable(cached[1])
+		return cached[1]
+	try:
+		sample = await hrrr_weather_service.refresh_point(lat, lon, when=when, persist=False)
+	except HrrrDataUnavailable as exc:
+		_remember_history_sample(key, str(exc))
+		raise
+	_remember_history_sample(key, sample)
+	return sample
+
+
+def _remember_history_sample(key: tuple[float, float, str], value: HrrrSample | str) -> None:
+	ttl = HISTORY_MISS_TTL_SECONDS if isinstance(value, str) else HISTORY_SAMPLE_TTL_SECONDS
+	_HISTORY_SAMPLES[key] = (time.monotonic() + ttl, value)
+	_HISTORY_SAMPLES.move_to_end(key)
+	if len(_HISTORY_SAMPLES) > HISTORY_SAMPLE_CACHE_SIZE:
+		_HISTORY_SAMPLES.popitem(last=False)
+
+
 async def _build_station_weather_response(
 	lat: float,
 	lon: float,
@@ -510,27 +621,23 @@ async def _build_station_weather_response(
 
 	window = _resolve_station_window(requested_hours)
 	observation_dicts, station_info = await weather_service.get_observations(lat, lon, window)
-	telemetry_entries = [_telemetry_from_station(entry) for entry in observation_dicts]
-	coverage_hours = _calculate_coverage_hours(
-		[{"timestamp": entry.timestamp} for entry in telemetry_entries if entry.timestamp]
-	) if telemetry_entries else 0.0
+	telemetry_entries = _telemetry_from_stations(observation_dicts)
+	coverage_hours = _calculate_coverage_hours(entry.timestamp for entry in telemetry_entries)
 	station_payload = None
 	if station_info:
-		station_data = dict(station_info)
-		identifier = station_data.get("identifier")
-		override = STATION_OVERRIDES.get(identifier)
-		if override:
-			for key, value in override.items():
-				station_data[key] = value
+		# Only copy the (service-cached) station mapping when an override applies.
+		override = STATION_OVERRIDES.get(station_info.get("identifier"))
+		station_data = {**station_info, **override} if override else station_info
 		station_payload = WeatherStation(**station_data)
 	sources = _collect_sources(telemetry_entries)
 	if not sources:
 		sources = ["noaa_nws"]
-	return WeatherResponse(
+	# Entries and station were validated above; the envelope only holds values built here.
+	return WeatherResponse.model_construct(
 		location={"lat": lat, "lon": lon},
 		requested_hours=window,
 		coverage_hours=coverage_hours,
-		available_windows=ALLOWED_WINDOWS[:],
+		available_windows=_AVAILABLE_WINDOWS,
 		data=telemetry_entries,
 		station=station_payload,
 		sources=sources,
@@ -547,12 +654,9 @@ def _build_hrrr_weather_response(
 	requested_hours: float,
 	hrrr_error: str | None,
 ) -> WeatherResponse:
-	coverage_hours = _calculate_coverage_hours(
-		[{"timestamp": entry.timestamp} for entry in hrrr_entries if entry.timestamp]
-	) if hrrr_entries else 0.0
-	available_windows = ALLOWED_WINDOWS[:]
+	coverage_hours = _calculate_coverage_hours(entry.timestamp for entry in hrrr_entries)
 
-	station_payload = WeatherStation(
+	station_payload = WeatherStation.model_construct(
 		id="hrrr",
 		name="NOAA HRRR Forecast",
 		identifier="HRRR",
@@ -561,11 +665,11 @@ def _build_hrrr_weather_response(
 		distance_km=None,
 	)
 
-	return WeatherResponse(
+	return WeatherResponse.model_construct(
 		location={"lat": lat, "lon": lon},
 		requested_hours=requested_hours,
 		coverage_hours=coverage_hours,
-		available_windows=available_windows,
+		available_windows=_AVAILABLE_WINDOWS,
 		data=hrrr_entries,
 		station=station_payload,
 		sources=["noaa_hrrr"],
@@ -574,34 +678,56 @@ def _build_hrrr_weather_response(
 	)
 
 
-def _calculate_coverage_hours(observations: list[dict[str, object]]) -> float:
-	timestamps: list[datetime] = []
-	for entry in observations:
-		value = entry.get("timestamp")
-		if isinstance(value, str):
-			try:
-				timestamps.append(datetime.fromisoformat(value.replace("Z", "+00:00")))
-			except ValueError:
-				continue
-	if len(timestamps) < 2:
+def _calculate_coverage_hours(timestamps: Iterable[str | None]) -> float:
+	# Coverage only needs the span. Series stamps repeat across requests, so
+	# the memoized parser turns most of this into cache lookups; values that
+	# do not parse are skipped.
+	parsed = [moment for moment in map(_parse_iso_timestamp, timestamps) if moment is not None]
+	if not parsed:
 		return 0.0
-	timestamps.sort()
-	delta = timestamps[-1] - timestamps[0]
-	return round(delta.total_seconds() / 3600.0, 2)
+	return round((max(parsed) - min(parsed)).total_seconds() / 3600.0, 2)
 
 
 def _format_timestamp(value: datetime) -> str:
-	return value.astimezone(timezone.utc).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+	return _format_epoch_seconds(int(value.replace(microsecond=0).timestamp()))
 
 
-def _ensure_hrrr_enabled() -> None:
-	if not settings.hrrr_enabled:
-		raise HTTPException(status_code=404, detail="HRRR integration is disabled")
+@lru_cache(maxsize=4096)
+def _format_epoch_seconds(seconds: int) -> str:
+	# Series timestamps land on the same few dozen hours across requests. A UTC
+	# isoformat() always ends in "+00:00", so the suffix is swapped by slicing.
+	return datetime.fromtimestamp(seconds, tz=timezone.utc).isoformat()[:-6] + "Z"
+
+
+def _json_bytes_response(content: bytes) -> Response:
+	return Response(content=content, media_type="application/json")
+
+
+async def _cached_hrrr_status_json(*, history_limit: int) -> bytes:
+	# Dashboards poll status every few seconds while it only changes on refresh
+	# boundaries. The lock makes concurrent misses share one cache walk, and the
+	# serialized body is cached so hits skip model dumping entirely.
+	cached = _STATUS_CACHE.get(history_limit)
+	if cached is not None and cached[0] > time.monotonic():
+		return cached[1]
+	async with _STATUS_LOCK:
+		cached = _STATUS_CACHE.get(history_limit)
+		if cached is not None and cached[0] > time.monotonic():
+			return cached[1]
+		response = await _build_hrrr_status_response(history_limit=history_limit)
+		content = _STATUS_RESPONSE_ADAPTER.dump_json(response)
+		_STATUS_CACHE[history_limit] = (time.monotonic() + HRRR_STATUS_TTL_SECONDS, content)
+		return content
 
 
 async def _build_hrrr_status_response(*, history_limit: int) -> "HrrrStatusResponse":
-	status_payload = await hrrr_weather_service.status(history_limit=history_limit)
-	cache_summary = await asyncio.to_thread(_scan_cache_summary, Path(settings.hrrr_cache_dir))
+	# The service status, cache walk and latest-sample read are independent,
+	# so the filesystem scan overlaps the two in-memory lookups.
+	status_payload, cache_summary, latest_sample = await asyncio.gather(
+		hrrr_weather_service.status(history_limit=history_limit),
+		asyncio.to_thread(_scan_cache_summary, Path(settings.hrrr_cache_dir)),
+		hrrr_weather_service.latest_default(),
+	)
 	status_payload.setdefault("cache_dir", cache_summary["cache_dir"])
 	status_payload.update(
 		{
@@ -610,7 +736,6 @@ async def _build_hrrr_status_response(*, history_limit: int) -> "HrrrStatusRespo
 			"cache_latest_modified": cache_summary["latest_modified"],
 		}
 	)
-	latest_sample = await hrrr_weather_service.latest_default()
 	latest_snapshot: HrrrSnapshot | None = None
 	if latest_sample is not None:
 		lat_meta = latest_sample.metadata.get("lat")
@@ -620,9 +745,11 @@ async def _build_hrrr_status_response(*, history_limit: int) -> "HrrrStatusRespo
 		if lat is not None and lon is not None:
 			latest_snapshot = _marshal_hrrr_sample(lat, lon, latest_sample, persisted=None)
 	recent_fetches_payload = status_payload.pop("recent_fetches", [])
-	return HrrrStatusResponse(
+	# The service status and fetch records are typed by HrrrWeatherService
+	# (HrrrFetchStatus.to_dict), so the response is assembled without validation.
+	return HrrrStatusResponse.model_construct(
 		latest_sample=latest_snapshot,
-		recent_fetches=[HrrrFetchStatusModel(**entry) for entry in recent_fetches_payload],
+		recent_fetches=[HrrrFetchStatusModel.model_construct(**entry) for entry in recent_fetches_payload],
 		**status_payload,
 	)
 
@@ -630,10 +757,21 @@ async def _build_hrrr_status_response(*, history_limit: int) -> "HrrrStatusRespo
 def _parse_iso_timestamp(value: Optional[str]) -> Optional[datetime]:
 	if value is None:
 		return None
+	return _parse_iso_utc(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso_utc(value: str) -> Optional[datetime]:
+	# Python 3.11+ fromisoformat accepts the trailing "Z" directly and returns
+	# the timezone.utc singleton for it, so canonical stamps skip astimezone().
+	# Hourly HRRR/station timestamps repeat across requests, so results are memoized.
 	try:
-		return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
+		parsed = datetime.fromisoformat(value)
 	except ValueError:
 		return None
+	if parsed.tzinfo is timezone.utc:
+		return parsed
+	return parsed.astimezone(timezone.utc)
 
 
 def _resolve_refresh_minutes(status_payload: dict[str, object]) -> float:
@@ -647,34 +785,37 @@ def _resolve_refresh_minutes(status_payload: dict[str, object]) -> float:
 
 
 def _marshal_hrrr_sample(lat: float, lon: float, sample: HrrrSample, *, persisted: bool | None) -> HrrrSnapshot:
+	# The service hands back the same HrrrSample object until the point is
+	# refreshed, so status/point requests re-marshal it repeatedly. Entries
+	# hold the sample itself and are only reused when it is the very same
+	# object, which keeps a recycled id() from matching a stale snapshot.
+	key = (id(sample), round(lat, 5), round(lon, 5), persisted)
+	cached = _SNAPSHOT_CACHE.get(key)
+	if cached is not None and cached[0] is sample:
+		_SNAPSHOT_CACHE.move_to_end(key)
+		return cached[1]
+	snapshot = _build_hrrr_snapshot(lat, lon, sample, persisted=persisted)
+	_SNAPSHOT_CACHE[key] = (sample, snapshot)
+	_SNAPSHOT_CACHE.move_to_end(key)
+	if len(_SNAPSHOT_CACHE) > SNAPSHOT_CACHE_SIZE:
+		_SNAPSHOT_CACHE.popitem(last=False)
+	return snapshot
+
+
+def _build_hrrr_snapshot(lat: float, lon: float, sample: HrrrSample, *, persisted: bool | None) -> HrrrSnapshot:
 	run = sample.run
-	fields = HrrrFields(
+	# HRRR samples carry floats produced by the service, so the response
+	# models are built without re-validating them.
+	fields = HrrrFields.model_construct(
 		temperature_c=sample.temperature_c,
 		humidity_pct=sample.humidity_pct,
 		wind_speed_m_s=sample.wind_speed_m_s,
 		pressure_hpa=sample.pressure_hpa,
-		solar_radiation_w_m2=sample.solar_radiation_w_m2,
-		solar_radiation_mj_m2_h=(sample.solar_radiation_w_m2 * SOLAR_W_TO_MJ) if sample.solar_radiation_w_m2 is not None else None,
-		solar_radiation_diffuse_w_m2=sample.solar_radiation_diffuse_w_m2,
-		solar_radiation_diffuse_mj_m2_h=(sample.solar_radiation_diffuse_w_m2 * SOLAR_W_TO_MJ)
-		if sample.solar_radiation_diffuse_w_m2 is not None
-		else None,
-		solar_radiation_direct_w_m2=sample.solar_radiation_direct_w_m2,
-		solar_radiation_direct_mj_m2_h=(sample.solar_radiation_direct_w_m2 * SOLAR_W_TO_MJ)
-		if sample.solar_radiation_direct_w_m2 is not None
-		else None,
-		solar_radiation_clear_w_m2=sample.solar_radiation_clear_w_m2,
-		solar_radiation_clear_mj_m2_h=(sample.solar_radiation_clear_w_m2 * SOLAR_W_TO_MJ)
-		if sample.solar_radiation_clear_w_m2 is not None
-		else None,
-		solar_radiation_clear_up_w_m2=sample.solar_radiation_clear_up_w_m2,
-		solar_radiation_clear_up_mj_m2_h=(sample.solar_radiation_clear_up_w_m2 * SOLAR_W_TO_MJ)
-		if sample.solar_radiation_clear_up_w_m2 is not None
-		else None,
+		**_solar_fields(_SOLAR_W_VALUES(sample), _SOLAR_COMPONENTS),
 	)
-	return HrrrSnapshot(
+	return HrrrSnapshot.model_construct(
 		location={"lat": round(lat, 5), "lon": round(lon, 5)},
-		run=HrrrRunInfo(
+		run=HrrrRunInfo.model_construct(
 			cycle=run.cycle.isoformat(timespec="seconds"),
 			forecast_hour=run.forecast_hour,
 			valid_time=run.valid_time.isoformat(timespec="seconds"),
@@ -685,52 +826,59 @@ def _marshal_hrrr_sample(lat: float, lon: float, sample: HrrrSample, *, persiste
 		persisted=persisted,
 	)
 
+
+def _w_to_mj(value: Optional[float]) -> Optional[float]:
+	return value * SOLAR_W_TO_MJ if value is not None else None
+
+
+def _solar_fields(
+	values: tuple[Optional[float], ...],
+	components: tuple[tuple[str, str], ...],
+) -> dict[str, Optional[float]]:
+	fields: dict[str, Optional[float]] = {}
+	for value, (w_name, mj_name) in zip(values, components):
+		fields[w_name] = value
+		fields[mj_name] = _w_to_mj(value)
+	return fields
+
+
 def _telemetry_from_hrrr(sample: HrrrSample) -> WeatherTelemetry:
-	valid_time_iso = _format_timestamp(sample.run.valid_time)
-	return WeatherTelemetry(
-		timestamp=valid_time_iso,
+	pressure_hpa = sample.pressure_hpa
+	return WeatherTelemetry.model_construct(
+		timestamp=_format_timestamp(sample.run.valid_time),
 		station="HRRR",
 		temperature_c=sample.temperature_c,
 		humidity_pct=sample.humidity_pct,
-		pressure_hpa=sample.pressure_hpa,
-		pressure_kpa=(sample.pressure_hpa / 10.0) if sample.pressure_hpa is not None else None,
-		solar_radiation_w_m2=sample.solar_radiation_w_m2,
-		solar_radiation_mj_m2_h=(
-			sample.solar_radiation_w_m2 * SOLAR_W_TO_MJ if sample.solar_radiation_w_m2 is not None else None
-		),
-		solar_radiation_diffuse_w_m2=sample.solar_radiation_diffuse_w_m2,
-		solar_radiation_diffuse_mj_m2_h=(
-			sample.solar_radiation_diffuse_w_m2 * SOLAR_W_TO_MJ if sample.solar_radiation_diffuse_w_m2 is not None else None
-		),
-		solar_radiation_direct_w_m2=sample.solar_radiation_direct_w_m2,
-		solar_radiation_direct_mj_m2_h=(
-			sample.solar_radiation_direct_w_m2 * SOLAR_W_TO_MJ if sample.solar_radiation_direct_w_m2 is not None else None
-		),
-		solar_radiation_clear_w_m2=sample.solar_radiation_clear_w_m2,
-		solar_radiation_clear_mj_m2_h=(
-			sample.solar_radiation_clear_w_m2 * SOLAR_W_TO_MJ if sample.solar_radiation_clear_w_m2 is not None else None
-		),
+		pressure_hpa=pressure_hpa,
+		pressure_kpa=(pressure_hpa / 10.0) if pressure_hpa is not None else None,
+		**_solar_fields(_TELEMETRY_SOLAR_W_VALUES(sample), _TELEMETRY_SOLAR_COMPONENTS),
 		wind_speed_m_s=sample.wind_speed_m_s,
 		source="noaa_hrrr",
 	)
 
 
-def _telemetry_from_station(entry: dict[str, Any]) -> WeatherTelemetry:
+def _telemetry_from_stations(observations: list[dict[str, Any]]) -> list[WeatherTelemetry]:
+	# Station observations are external data, so they are still validated, but
+	# as one list through a prebuilt adapter rather than a model call per entry.
+	return _TELEMETRY_LIST_ADAPTER.validate_python([_station_telemetry_fields(entry) for entry in observations])
+
+
+def _station_telemetry_fields(entry: dict[str, Any]) -> dict[str, Any]:
 	pressure_hpa = entry.get("pressure_hpa")
 	solar_w = entry.get("solar_radiation_w_m2")
 	source = entry.get("source") or "noaa_nws"
-	return WeatherTelemetry(
-		timestamp=entry.get("timestamp"),
-		station=entry.get("station"),
-		temperature_c=entry.get("temperature_c"),
-		humidity_pct=entry.get("humidity_pct"),
-		pressure_hpa=pressure_hpa,
-		pressure_kpa=(pressure_hpa / 10.0) if pressure_hpa is not None else None,
-		solar_radiation_w_m2=solar_w,
-		solar_radiation_mj_m2_h=(solar_w * SOLAR_W_TO_MJ) if solar_w is not None else None,
-		wind_speed_m_s=entry.get("wind_speed_m_s"),
-		source=source,
-	)
+	return {
+		"timestamp": entry.get("timestamp"),
+		"station": entry.get("station"),
+		"temperature_c": entry.get("temperature_c"),
+		"humidity_pct": entry.get("humidity_pct"),
+		"pressure_hpa": pressure_hpa,
+		"pressure_kpa": (pressure_hpa / 10.0) if pressure_hpa is not None else None,
+		"solar_radiation_w_m2": solar_w,
+		"solar_radiation_mj_m2_h": _w_to_mj(solar_w),
+		"wind_speed_m_s": entry.get("wind_speed_m_s"),
+		"source": source,
+	}
 
 
 def _resolve_station_window(hours: float) -> float:
@@ -740,16 +888,20 @@ def _resolve_station_window(hours: float) -> float:
 
 
 def _collect_sources(entries: list[WeatherTelemetry]) -> list[str]:
-	seen: list[str] = []
+	# Insertion-ordered dict keeps first-seen order with O(1) membership. Most
+	# series repeat one source string, so each distinct raw value is split once.
+	seen: dict[str, None] = {}
+	raw_seen: set[str] = set()
 	for entry in entries:
-		if not entry.source:
+		raw = entry.source
+		if not raw or raw in raw_seen:
 			continue
-		for token in entry.source.split(","):
+		raw_seen.add(raw)
+		for token in raw.split(","):
 			label = token.strip()
-			if not label or label in seen:
-				continue
-			seen.append(label)
-	return seen
+			if label:
+				seen.setdefault(label)
+	return list(seen)
 
 
 def _testing_station_response(
@@ -765,18 +917,14 @@ def _testing_station_response(
 	if abs(lat - target_lat) > 0.01 or abs(lon - target_lon) > 0.01:
 		return None
 	window = _resolve_station_window(requested_hours)
-	telemetry_entries = [
-		_telemetry_from_station(entry) for entry in TESTING_STATION_FIXTURE["observations"]
-	]
-	coverage_hours = _calculate_coverage_hours(
-		[{"timestamp": entry.timestamp} for entry in telemetry_entries if entry.timestamp]
-	) if telemetry_entries else 0.0
+	telemetry_entries = _telemetry_from_stations(TESTING_STATION_FIXTURE["observations"])
+	coverage_hours = _calculate_coverage_hours(entry.timestamp for entry in telemetry_entries)
 	station_payload = WeatherStation(**TESTING_STATION_FIXTURE["station"])
 	return WeatherResponse(
 		location={"lat": lat, "lon": lon},
 		requested_hours=window,
 		coverage_hours=coverage_hours,
-		available_windows=ALLOWED_WINDOWS[:],
+		available_windows=_AVAILABLE_WINDOWS,
 		data=telemetry_entries,
 		station=station_payload,
 		sources=["noaa_nws"],
@@ -791,13 +939,7 @@ def _scan_cache_summary(cache_dir: Path) -> dict[str, object]:
 	total_bytes = 0
 	latest: Optional[datetime] = None
 	if root.exists():
-		for path in root.rglob("*"):
-			if not path.is_file():
-				continue
-			try:
-				stat = path.stat()
-			except OSError:
-				continue
+		for _, stat in iter_cache_files(root):
 			total_files += 1
 			total_bytes += stat.st_size
 			modified = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
@@ -812,90 +954,99 @@ def _scan_cache_summary(cache_dir: Path) -> dict[str, object]:
 
 
 def _collect_cache_entries(cache_dir: Path, order: str, limit: int) -> dict[str, object]:
-	summary = _scan_cache_dir(cache_dir)
-	entries = summary["entries"]
+	scan = _scan_cache_dir(cache_dir)
 	if order not in CACHE_ENTRY_ORDERS:
 		order = "newest"
-	reverse = order in {"newest", "largest"}
-	if order in {"newest", "oldest"}:
-		key = lambda entry: entry["modified"] or datetime.min
+	# Rank positions by the parallel mtime/size columns and only describe the
+	# ``limit`` survivors; the bounded heap keeps sorted()'s tie order.
+	column: list[int] | list[float] = scan.mtimes if order in {"newest", "oldest"} else scan.sizes
+	positions = range(len(column))
+	if order in {"newest", "largest"}:
+		selected = heapq.nlargest(limit, positions, key=column.__getitem__)
 	else:
-		key = lambda entry: entry["bytes"]
-	sorted_entries = sorted(entries, key=key, reverse=reverse)[:limit]
+		selected = heapq.nsmallest(limit, positions, key=column.__getitem__)
+	root = Path(scan.cache_dir)
 	payload_entries = [
-		CacheEntryModel(
-			path=item["path"],
-			bytes=item["bytes"],
-			modified=_format_timestamp(item["modified"]) if item["modified"] else None,
-			kind=item["kind"],
-			cycle=item["cycle"],
-			forecast_hour=item["forecast_hour"],
-			valid_time=item["valid_time"],
-			domain=item["domain"],
-			has_metadata=item["has_metadata"],
-		)
-		for item in sorted_entries
+		_describe_cache_entry(root, scan.paths[index], scan.sizes[index], scan.mtimes[index], scan.sidecars)
+		for index in selected
 	]
 	return {
-		"cache_dir": summary["cache_dir"],
-		"total_files": summary["total_files"],
-		"total_bytes": summary["total_bytes"],
+		"cache_dir": scan.cache_dir,
+		"total_files": scan.total_files,
+		"total_bytes": scan.total_bytes,
 		"order": order,
 		"limit": limit,
 		"entries": payload_entries,
 	}
 
 
-def _scan_cache_dir(cache_dir: Path) -> dict[str, object]:
+@dataclass(slots=True)
+class _CacheScan:
+	"""Column-oriented cache listing.
+
+	Parallel path/size/mtime lists let ranking index plain lists, so per-file
+	metadata is only derived for the rows that are returned.
+	"""
+
+	cache_dir: str
+	paths: list[str]
+	sizes: list[int]
+	mtimes: list[float]
+	# Metadata sidecars seen during the walk, so GRIB rows need no extra stat.
+	sidecars: set[str]
+
+	@property
+	def total_files(self) -> int:
+		return len(self.paths)
+
+	@property
+	def total_bytes(self) -> int:
+		return sum(self.sizes)
+
+
+def _scan_cache_dir(cache_dir: Path) -> _CacheScan:
 	root = cache_dir.resolve()
 	root.mkdir(parents=True, exist_ok=True)
-	entries: list[dict[str, object]] = []
-	total_bytes = 0
-	latest: Optional[datetime] = None
-	for path in root.rglob("*"):
-		if not path.is_file():
-			continue
-		try:
-			stat = path.stat()
-		except OSError:
-			continue
-		total_bytes += stat.st_size
-		modified = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
-		if latest is None or modified > latest:
-			latest = modified
-		cycle, forecast_hour, valid_time, domain = _parse_cache_metadata(path, root)
-		has_metadata = path.suffix.lower() == ".grib2" and path.with_suffix(path.suffix + ".json").exists()
-		entries.append(
-			{
-				"path": path.relative_to(root).as_posix(),
-				"bytes": stat.st_size,
-				"modified": modified,
-				"kind": _classify_cache_entry(path),
-				"cycle": cycle,
-				"forecast_hour": forecast_hour,
-				"valid_time": valid_time,
-				"domain": domain,
-				"has_metadata": has_metadata,
-			}
-		)
-	return {
-		"entries": entries,
-		"cache_dir": str(root),
-		"total_files": len(entries),
-		"total_bytes": total_bytes,
-		"latest_modified": latest,
-	}
+	scan = _CacheScan(cache_dir=str(root), paths=[], sizes=[], mtimes=[], sidecars=set())
+	for raw_path, stat in iter_cache_files(root):
+		scan.paths.append(raw_path)
+		scan.sizes.append(stat.st_size)
+		scan.mtimes.append(stat.st_mtime)
+		if raw_path.endswith(".json"):
+			scan.sidecars.add(raw_path)
+	return scan
+
+
+def _describe_cache_entry(
+	root: Path,
+	raw_path: str,
+	size: int,
+	mtime: float,
+	sidecars: set[str],
+) -> CacheEntryModel:
+	path = Path(raw_path)
+	cycle, forecast_hour, valid_time, domain = _parse_cache_metadata(path, root)
+	has_metadata = path.suffix.lower() == ".grib2" and (raw_path + ".json") in sidecars
+	return CacheEntryModel(
+		path=path.relative_to(root).as_posix(),
+		bytes=size,
+		modified=_format_timestamp(datetime.fromtimestamp(mtime, tz=timezone.utc)),
+		kind=_classify_cache_entry(path),
+		cycle=cycle,
+		forecast_hour=forecast_hour,
+		valid_time=valid_time,
+		domain=domain,
+		has_metadata=has_metadata,
+	)
 
 
 def _classify_cache_entry(path: Path) -> str:
-	name = path.name.lower()
-	if name.endswith(".grib2"):
-		return "grib"
-	if name.endswith(".grib2.json") or name.endswith(".json"):
-		return "metadata"
-	if name.endswith(".jsonl") or "log" in name:
-		return "log"
-	return "other"
+	name = path.name
+	dot = name.rfind(".")
+	kind = _CACHE_KIND_BY_SUFFIX.get(name[dot:].lower()) if dot >= 0 else None
+	if kind is not None:
+		return kind
+	return "log" if "log" in name.lower() else "other"
 
 
 def _parse_cache_metadata(path: Path, root: Path) -> tuple[Optional[str], Optional[int], Optional[str], Optional[str]]:
@@ -908,8 +1059,8 @@ def _parse_cache_metadata(path: Path, root: Path) -> tuple[Optional[str], Option
 	date_part = parts[0]
 	domain = parts[1] if len(parts) > 1 else None
 	filename = path.name
-	date_match = re.match(r"hrrr\.(\d{8})", date_part)
-	run_match = re.match(r"hrrr\.t(\d{2})z\.wrfsfcf(\d{2})", filename)
+	date_match = _CACHE_DATE_RE.match(date_part)
+	run_match = _CACHE_RUN_RE.match(filename)
 	if not date_match or not run_match:
 		return None, None, None, domain
 	day = date_match.group(1)
@@ -931,44 +1082,8 @@ def _parse_cache_metadata(path: Path, root: Path) -> tuple[Optional[str], Option
 def _delete_cache_entries(cache_dir: Path, payload: CacheMutationRequest) -> dict[str, object]:
 	cache_root = cache_dir.resolve()
 	cache_root.mkdir(parents=True, exist_ok=True)
-	processed = 0
-	bytes_removed = 0
-	details: list[CacheMutationDetail] = []
-	for entry in payload.entries:
-		try:
-			targets = _resolve_cache_targets(cache_root, entry, include_metadata=payload.include_metadata)
-		except ValueError as exc:
-			details.append(CacheMutationDetail(path=entry, status="invalid", detail=str(exc)))
-			continue
-		for path in targets:
-			if not path.exists():
-				details.append(CacheMutationDetail(path=str(path.relative_to(cache_root)), status="missing"))
-				continue
-			processed += 1
-			try:
-				size = path.stat().st_size
-			except OSError:
-				size = None
-			try:
-				path.unlink()
-				if size:
-					bytes_removed += size
-				details.append(
-					CacheMutationDetail(
-						path=str(path.relative_to(cache_root)),
-						bytes=size,
-						status="deleted",
-					)
-				)
-			except OSError as exc:
-				details.append(
-					CacheMutationDetail(
-						path=str(path.relative_to(cache_root)),
-						bytes=size,
-						status="error",
-						detail=str(exc),
-					)
-				)
+	plan = _plan_cache_mutation(cache_root, payload)
+	processed, bytes_removed, details = _run_cache_mutation(plan, _delete_cache_file)
 	return {
 		"processed": processed,
 		"bytes_removed": bytes_removed,
@@ -986,46 +1101,12 @@ def _store_cache_entries(cache_dir: Path, archive_dir: Path, payload: CacheStore
 	folder = timestamp if not label else f"{timestamp}_{label}"
 	destination_root = archive_root / folder
 	destination_root.mkdir(parents=True, exist_ok=True)
-	processed = 0
-	bytes_moved = 0
-	details: list[CacheMutationDetail] = []
-	for entry in payload.entries:
-		try:
-			targets = _resolve_cache_targets(cache_root, entry, include_metadata=payload.include_metadata)
-		except ValueError as exc:
-			details.append(CacheMutationDetail(path=entry, status="invalid", detail=str(exc)))
-			continue
-		for path in targets:
-			if not path.exists():
-				details.append(CacheMutationDetail(path=str(path.relative_to(cache_root)), status="missing"))
-				continue
-			dest_path = destination_root / path.relative_to(cache_root)
-			dest_path.parent.mkdir(parents=True, exist_ok=True)
-			try:
-				size = path.stat().st_size
-			except OSError:
-				size = None
-			try:
-				shutil.move(str(path), str(dest_path))
-				processed += 1
-				if size:
-					bytes_moved += size
-				details.append(
-					CacheMutationDetail(
-						path=str(dest_path.relative_to(archive_root)),
-						bytes=size,
-						status="stored",
-					)
-				)
-			except OSError as exc:
-				details.append(
-					CacheMutationDetail(
-						path=str(path.relative_to(cache_root)),
-						bytes=size,
-						status="error",
-						detail=str(exc),
-					)
-				)
+	archive_device = os.stat(destination_root).st_dev
+	plan = _plan_cache_mutation(cache_root, payload)
+	processed, bytes_moved, details = _run_cache_mutation(
+		plan,
+		lambda path, relative: _store_cache_file(destination_root, folder, archive_device, path, relative),
+	)
 	return {
 		"processed": processed,
 		"bytes_moved": bytes_moved,
@@ -1035,10 +1116,122 @@ def _store_cache_entries(cache_dir: Path, archive_dir: Path, payload: CacheStore
 	}
 
 
-def _resolve_cache_targets(cache_root: Path, entry: str, *, include_metadata: bool) -> list[Optional[Path]]:
+def _plan_cache_mutation(
+	cache_root: Path,
+	payload: CacheMutationRequest,
+) -> list[tuple[Path, str] | CacheMutationDetail]:
+	# Resolve every requested entry up front, in request order. Invalid entries
+	# and repeats of an already planned file become final details so the
+	# parallel file operations never race on the same path. Resolved targets
+	# are known to sit below ``cache_root``, so their relative form is a slice.
+	prefix_length = len(os.path.join(str(cache_root), ""))
+	plan: list[tuple[Path, str] | CacheMutationDetail] = []
+	planned: set[Path] = set()
+	resolved: dict[str, list[Path] | ValueError] = {}
+	for entry in payload.entries:
+		targets = resolved.get(entry)
+		if targets is None:
+			try:
+				targets = _resolve_cache_targets(cache_root, entry, include_metadata=payload.include_metadata)
+			except ValueError as exc:
+				targets = exc
+			resolved[entry] = targets
+		if isinstance(targets, ValueError):
+			plan.append(CacheMutationDetail(path=entry, status="invalid", detail=str(targets)))
+			continue
+		for path in targets:
+			relative = str(path)[prefix_length:]
+			if path in planned:
+				plan.append(CacheMutationDetail(path=relative, status="missing"))
+				continue
+			planned.add(path)
+			plan.append((path, relative))
+	return plan
+
+
+def _run_cache_mutation(
+	plan: list[tuple[Path, str] | CacheMutationDetail],
+	action: Callable[[Path, str], tuple[CacheMutationDetail, bool, int]],
+) -> tuple[int, int, list[CacheMutationDetail]]:
+	"""Apply ``action`` to each planned file on a small thread pool.
+
+	Moves and unlinks are independent per file, so a batch finishes in
+	roughly the time of its slowest files. Details keep the request order.
+	"""
+	targets = [item for item in plan if not isinstance(item, CacheMutationDetail)]
+	outcomes: Iterator[tuple[CacheMutationDetail, bool, int]] = iter(())
+	if targets:
+		with ThreadPoolExecutor(max_workers=min(CACHE_MUTATION_WORKERS, len(targets))) as executor:
+			outcomes = iter(list(executor.map(lambda target: action(*target), targets)))
+	processed = 0
+	total_bytes = 0
+	details: list[CacheMutationDetail] = []
+	for item in plan:
+		if isinstance(item, CacheMutationDetail):
+			details.append(item)
+			continue
+		detail, counted, size = next(outcomes)
+		if counted:
+			processed += 1
+		total_bytes += size
+		details.append(detail)
+	return processed, total_bytes, details
+
+
+def _delete_cache_file(path: Path, relative: str) -> tuple[CacheMutationDetail, bool, int]:
+	# One stat answers both "does it exist" and "how big is it".
+	try:
+		size: int | None = os.stat(path).st_size
+	except (FileNotFoundError, NotADirectoryError):
+		return CacheMutationDetail(path=relative, status="missing"), False, 0
+	except OSError:
+		size = None
+	try:
+		os.unlink(path)
+	except OSError as exc:
+		return CacheMutationDetail(path=relative, bytes=size, status="error", detail=str(exc)), True, 0
+	return CacheMutationDetail(path=relative, bytes=size, status="deleted"), True, size or 0
+
+
+def _store_cache_file(
+	destination_root: Path,
+	folder: str,
+	archive_device: int,
+	path: Path,
+	relative: str,
+) -> tuple[CacheMutationDetail, bool, int]:
+	try:
+		stat = os.stat(path)
+	except (FileNotFoundError, NotADirectoryError):
+		return CacheMutationDetail(path=relative, status="missing"), False, 0
+	except OSError:
+		stat = None
+	size = stat.st_size if stat is not None else None
+	dest_path = destination_root / relative
+	dest_path.parent.mkdir(parents=True, exist_ok=True)
+	try:
+		if stat is not None and stat.st_dev == archive_device:
+			# Same filesystem: a single rename, skipping shutil.move's checks.
+			os.replace(path, dest_path)
+		else:
+			shutil.move(str(path), str(dest_path))
+	except OSError as exc:
+		return CacheMutationDetail(path=relative, bytes=size, status="error", detail=str(exc)), False, 0
+	return (
+		CacheMutationDetail(path=os.path.join(folder, relative), bytes=size, status="stored"),
+		True,
+		size or 0,
+	)
+
+
+def _resolve_cache_targets(cache_root: Path, entry: str, *, include_metadata: bool) -> list[Path]:
 	clean = entry.strip().lstrip("/\\")
 	if not clean:
 		raise ValueError("empty entry path")
+	# Entries that climb out of the cache lexically are rejected before
+	# resolve() touches the filesystem; resolve() still catches symlink escapes.
+	if os.path.normpath(clean).replace("\\", "/").split("/", 1)[0] == "..":
+		raise ValueError("entry outside cache directory")
 	target = (cache_root / Path(clean)).resolve()
 	try:
 		target.relative_to(cache_root)
@@ -1053,5 +1246,5 @@ def _resolve_cache_targets(cache_root: Path, entry: str, *, include_metadata: bo
 def _sanitize_label(label: str | None) -> str | None:
 	if not label:
 		return None
-	sanitized = re.sub(r"[^A-Za-z0-9_-]+", "_", label).strip("_")
+	sanitized = _LABEL_UNSAFE_RE.sub("_", label).strip("_")
 	return sanitized or None
@@ -1,6 +1,6 @@
 """Lightweight auth helpers used by unit tests and local development."""
 
-from .apple import AppleIdentity, AppleIdentityError, verify_apple_id_token
+from .apple import AppleIdentity, AppleIdentityError, close_apple_http_client, verify_apple_id_token
 from .google import GoogleIdentity, GoogleIdentityError, verify_google_id_token
 from .jwt import AuthTokenError, create_access_token, verify_access_token
 
@@ -10,6 +10,7 @@ __all__ = [
     "AuthTokenError",
     "GoogleIdentity",
     "GoogleIdentityError",
+    "close_apple_http_client",
     "create_access_token",
     "verify_apple_id_token",
     "verify_access_token",
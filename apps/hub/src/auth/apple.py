@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
 import time
@@ -9,13 +10,20 @@ from dataclasses import dataclass
 from typing import Any, Sequence
 
 import httpx
-import rsa
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
 
 APPLE_ISSUER = "https://appleid.apple.com"
 APPLE_JWKS_URL = "https://appleid.apple.com/auth/keys"
 APPLE_JWKS_CACHE_TTL_SECONDS = 6 * 60 * 60
 
-_APPLE_JWKS_CACHE: tuple[float, list[dict[str, Any]]] | None = None
+# (fetched at, kid -> public key); JWKs are decoded once per fetch rather than per token.
+_APPLE_JWKS_CACHE: tuple[float, dict[str, rsa.RSAPublicKey]] | None = None
+# Serializes JWKS refreshes so concurrent sign-ins on a cold cache share one fetch.
+_APPLE_JWKS_LOCK = asyncio.Lock()
+# Created on first refresh and reused; closed by the app lifespan on shutdown.
+_APPLE_HTTP_CLIENT: httpx.AsyncClient | None = None
 
 
 @dataclass(slots=True)
@@ -30,7 +38,7 @@ class AppleIdentityError(RuntimeError):
     """Raised when an Apple ID token cannot be trusted."""
 
 
-def verify_apple_id_token(
+async def verify_apple_id_token(
     raw_token: str,
     *,
     allowed_client_ids: Sequence[str],
@@ -58,12 +66,13 @@ def verify_apple_id_token(
     if not key_id:
         raise AppleIdentityError("Apple token key id is missing")
 
-    jwk = _find_apple_key(key_id)
-    public_key = _public_key_from_jwk(jwk)
+    public_key = (await _fetch_apple_keys()).get(key_id)
+    if public_key is None:
+        raise AppleIdentityError("Unable to find Apple signing key")
     signing_input = f"{encoded_header}.{encoded_payload}".encode("ascii")
     try:
-        rsa.verify(signing_input, signature, public_key)
-    except rsa.VerificationError as exc:
+        public_key.verify(signature, signing_input, padding.PKCS1v15(), hashes.SHA256())
+    except InvalidSignature as exc:
         raise AppleIdentityError("Invalid Apple ID token signature") from exc
 
     issuer = str(payload.get("iss", "")).strip()
@@ -118,24 +127,31 @@ def verify_apple_id_token(
     )
 
 
-def _find_apple_key(key_id: str) -> dict[str, Any]:
-    keys = _fetch_apple_keys()
-    for key in keys:
-        if str(key.get("kid", "")).strip() == key_id:
-            return key
-    raise AppleIdentityError("Unable to find Apple signing key")
+async def _fetch_apple_keys() -> dict[str, rsa.RSAPublicKey]:
+    keys = _cached_apple_keys()
+    if keys is not None:
+        return keys
+    async with _APPLE_JWKS_LOCK:
+        keys = _cached_apple_keys()
+        if keys is not None:
+            return keys
+        return await _refresh_apple_keys()
+
+
+def _cached_apple_keys() -> dict[str, rsa.RSAPublicKey] | None:
+    if _APPLE_JWKS_CACHE is None:
+        return None
+    fetched_at, keys = _APPLE_JWKS_CACHE
+    if time.time() - fetched_at < APPLE_JWKS_CACHE_TTL_SECONDS:
+        return keys
+    return None
 
 
-def _fetch_apple_keys() -> list[dict[str, Any]]:
+async def _refresh_apple_keys() -> dict[str, rsa.RSAPublicKey]:
     global _APPLE_JWKS_CACHE
     now = time.time()
-    if _APPLE_JWKS_CACHE is not None:
-        fetched_at, keys = _APPLE_JWKS_CACHE
-        if now - fetched_at < APPLE_JWKS_CACHE_TTL_SECONDS:
-            return keys
-
     try:
-        response = httpx.get(APPLE_JWKS_URL, timeout=5.0)
+        response = await _apple_http_client().get(APPLE_JWKS_URL)
         response.raise_for_status()
         payload = response.json()
     except Exception as exc:
@@ -145,10 +161,17 @@ def _fetch_apple_keys() -> list[dict[str, Any]]:
     if not isinstance(keys_raw, list):
         raise AppleIdentityError("Apple signing keys response is invalid")
 
-    keys: list[dict[str, Any]] = []
+    keys: dict[str, rsa.RSAPublicKey] = {}
     for item in keys_raw:
-        if isinstance(item, dict):
-            keys.append(item)
+        if not isinstance(item, dict):
+            continue
+        key_id = str(item.get("kid", "")).strip()
+        if not key_id or key_id in keys:
+            continue
+        try:
+            keys[key_id] = _public_key_from_jwk(item)
+        except AppleIdentityError:
+            continue
     if not keys:
         raise AppleIdentityError("Apple signing keys are unavailable")
 
@@ -156,7 +179,21 @@ def _fetch_apple_keys() -> list[dict[str, Any]]:
     return keys
 
 
-def _public_key_from_jwk(jwk: dict[str, Any]) -> rsa.PublicKey:
+def _apple_http_client() -> httpx.AsyncClient:
+    global _APPLE_HTTP_CLIENT
+    if _APPLE_HTTP_CLIENT is None:
+        _APPLE_HTTP_CLIENT = httpx.AsyncClient(timeout=5.0)
+    return _APPLE_HTTP_CLIENT
+
+
+async def close_apple_http_client() -> None:
+    global _APPLE_HTTP_CLIENT
+    if _APPLE_HTTP_CLIENT is not None:
+        await _APPLE_HTTP_CLIENT.aclose()
+        _APPLE_HTTP_CLIENT = None
+
+
+def _public_key_from_jwk(jwk: dict[str, Any]) -> rsa.RSAPublicKey:
     if str(jwk.get("kty", "")).strip() != "RSA":
         raise AppleIdentityError("Unsupported Apple signing key type")
     n_raw = str(jwk.get("n", "")).strip()
@@ -166,9 +203,10 @@ def _public_key_from_jwk(jwk: dict[str, Any]) -> rsa.PublicKey:
 
     n = int.from_bytes(_b64url_decode(n_raw), byteorder="big")
     e = int.from_bytes(_b64url_decode(e_raw), byteorder="big")
-    if n <= 0 or e <= 0:
-        raise AppleIdentityError("Apple signing key is invalid")
-    return rsa.PublicKey(n, e)
+    try:
+        return rsa.RSAPublicNumbers(e=e, n=n).public_key()
+    except ValueError as exc:
+        raise AppleIdentityError("Apple signing key is invalid") from exc
 
 
 def _decode_json_segment(segment: str) -> dict[str, Any]:
@@ -11,9 +11,11 @@ from fastapi.responses import JSONResponse
 from fastapi.staticfiles import StaticFiles
 
 from config import settings
+from api.responses import PydanticJSONResponse
 from api.search_router import router as search_router
 from api.v1.router import router as v1_router
 from api.etkc_router import router as etkc_router
+from auth import close_apple_http_client
 from mqtt.client import startup as mqtt_startup, shutdown as mqtt_shutdown
 from services.plant_schedule import plant_schedule_service
 from services.weather import weather_service
@@ -52,12 +54,18 @@ def create_app() -> FastAPI:
             await weather_service.close()
             await hrrr_weather_service.close()
             await plant_lookup_service.close()
+            await close_apple_http_client()
 
     ui_dist_env = __import__("os").environ.get("PROJECTPLANT_UI_DIST")
     ui_dist = Path(ui_dist_env).resolve() if ui_dist_env else None
     ui_index = ui_dist / "index.html" if ui_dist and ui_dist.exists() else None
 
-    app = FastAPI(title=settings.app_name, version=settings.app_version, lifespan=lifespan)
+    app = FastAPI(
+        title=settings.app_name,
+        version=settings.app_version,
+        lifespan=lifespan,
+        default_response_class=PydanticJSONResponse,
+    )
     app.state.started_at = datetime.now(timezone.utc)
 
     app.add_middleware(
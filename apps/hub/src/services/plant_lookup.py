@@ -35,14 +35,22 @@ class _ConfiguredPowoApi(PowoApi):
         super().__init__(base_url.rstrip("/"))
         self._timeout = timeout
         self._headers = headers
+        self._client: httpx.Client | None = None
+
+    def _get_client(self) -> httpx.Client:
+        # One pooled client keeps POWO connections alive across worker-thread calls.
+        if self._client is None:
+            self._client = httpx.Client(timeout=self._timeout, headers=self._headers)
+        return self._client
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.close()
+            self._client = None
 
     def get(self, method: str, params: dict[str, Any] | None = None) -> httpx.Response:
         payload = dict(params or {})
-        response = httpx.get(
-            self._url(method, payload),
-            headers=self._headers,
-            timeout=self._timeout,
-        )
+        response = self._get_client().get(self._url(method, payload))
         if response.status_code == 249:
             time.sleep(5)
             return self.get(method, payload)
@@ -129,6 +137,7 @@ class PlantLookupService:
         if self._client:
             await self._client.aclose()
             self._client = None
+        await asyncio.to_thread(self._powo_api.close)
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
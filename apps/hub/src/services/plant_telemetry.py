@@ -288,14 +288,23 @@ class PotTelemetryStore:
         hours: float = 24.0,
         limit: int = 1440,
     ) -> List[Dict[str, Any]]:
+        rows = await self.list_rows(pot_id, hours=hours, limit=limit)
+        return [row.as_payload() for row in rows]
+
+    async def list_rows(
+        self,
+        pot_id: str,
+        *,
+        hours: float = 24.0,
+        limit: int = 1440,
+    ) -> List[PotTelemetryRow]:
         if not pot_id:
             return []
         window = max(hours, MIN_WINDOW_HOURS)
         cutoff = _ensure_iso(_utc_now() - timedelta(hours=window))
         clamped_limit = max(1, min(limit, self._max_rows))
         async with self._lock:
-            rows = await asyncio.to_thread(self._select_rows, pot_id, cutoff, clamped_limit)
-        return [row.as_payload() for row in rows]
+            return await asyncio.to_thread(self._select_rows, pot_id, cutoff, clamped_limit)
 
     def _select_rows(self, pot_id: str, cutoff_iso: str, limit: int) -> List[PotTelemetryRow]:
         normalized = (pot_id or "").strip().lower()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import time
+from bisect import bisect_left, bisect_right, insort
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Literal, Optional
@@ -140,26 +141,43 @@ def _generate_token() -> str:
     return uuid4().hex
 
 
+_REFERENCE_MATCH_CACHE_SIZE = 256
+
+
 class PlantCatalog:
     def __init__(self) -> None:
+        self._references_version = 0
+        self._users_version = 0
+        self._version = 0
         self._initialize_state()
 
     def _initialize_state(self) -> None:
         self._references: list[PlantReference] = _default_references()
+        self._reference_matches: dict[str, tuple[PlantReference, ...]] = {}
+        self._references_version += 1
         self._users: dict[str, UserAccount] = {user.id: user for user in _default_users()}
+        # Sorted id index backing cursor pagination; kept in step with ``_users``.
+        self._user_ids: list[str] = sorted(self._users)
         self._users_by_google_sub: dict[str, str] = {
             user.google_sub: user.id for user in self._users.values() if user.google_sub
         }
         self._users_by_apple_sub: dict[str, str] = {
             user.apple_sub: user.id for user in self._users.values() if user.apple_sub
         }
-        self._shares: dict[str, ShareRecord] = {share.id: share for share in _default_shares()}
+        self._users_version += 1
+        self._shares: dict[str, ShareRecord] = {}
+        # Per-participant view of ``_shares`` so share lookups scale with a
+        # user's own shares rather than every share in the catalog.
+        self._shares_by_user: dict[str, dict[str, ShareRecord]] = {}
+        for share in _default_shares():
+            self._index_share(share)
         self._share_cache: dict[str, set[str]] = {}
         self._verification_outbox: list[tuple[str, str]] = []
         self._pot_models: list[PotModel] = _default_pot_models(_DEFAULT_OWNER_ID)
         self._zones: list[IrrigationZone] = _default_zones(_DEFAULT_OWNER_ID)
         self._records: list[PlantRecord] = []
         self._next_id = 1
+        self._version += 1
 
     def reset(self) -> None:
         self._initialize_state()
@@ -167,6 +185,11 @@ class PlantCatalog:
     def list_users(self) -> list[UserAccount]:
         return list(self._users.values())
 
+    def list_users_page(self, *, after: str | None = None, limit: int = 100) -> list[UserAccount]:
+        """Return up to ``limit`` users ordered by id, starting after the ``after`` cursor."""
+        start = bisect_right(self._user_ids, after) if after is not None else 0
+        return [self._users[user_id] for user_id in self._user_ids[start : start + limit]]
+
     def get_user(self, user_id: str) -> UserAccount | None:
         return self._users.get(user_id)
 
@@ -227,6 +250,7 @@ class PlantCatalog:
                 display_name=cleaned_name,
                 picture=picture,
             )
+            self._users_version += 1
             self._invalidate_share_cache(updated.id)
             return updated
 
@@ -242,6 +266,7 @@ class PlantCatalog:
                 display_name=cleaned_name,
                 picture=picture,
             )
+            self._users_version += 1
             self._invalidate_share_cache(updated.id)
             return updated
 
@@ -260,8 +285,9 @@ class PlantCatalog:
             google_sub=cleaned_sub,
             avatar_url=picture,
         )
-        self._users[user_id] = user
+        self._insert_user(user)
         self._users_by_google_sub[cleaned_sub] = user_id
+        self._users_version += 1
         self._invalidate_share_cache(user_id)
         return user
 
@@ -285,6 +311,7 @@ class PlantCatalog:
                 email=cleaned_email,
                 display_name=cleaned_name,
             )
+            self._users_version += 1
             self._invalidate_share_cache(updated.id)
             return updated
 
@@ -302,6 +329,7 @@ class PlantCatalog:
                 email=cleaned_email,
                 display_name=cleaned_name,
             )
+            self._users_version += 1
             self._invalidate_share_cache(updated.id)
             return updated
 
@@ -321,8 +349,9 @@ class PlantCatalog:
             apple_sub=cleaned_sub,
             avatar_url=None,
         )
-        self._users[user_id] = user
+        self._insert_user(user)
         self._users_by_apple_sub[cleaned_sub] = user_id
+        self._users_version += 1
         self._invalidate_share_cache(user_id)
         return user
 
@@ -361,7 +390,8 @@ class PlantCatalog:
             apple_sub=None,
             avatar_url=None,
         )
-        self._users[user_id] = user
+        self._insert_user(user)
+        self._users_version += 1
         self._invalidate_share_cache(user_id)
         if token:
             self._queue_verification_email(user)
@@ -377,6 +407,7 @@ class PlantCatalog:
         user.email_verified = True
         user.verification_token = None
         user.updated_at = _now()
+        self._users_version += 1
         self._verification_outbox = [entry for entry in self._verification_outbox if entry[0] != user.email]
         return user
 
@@ -412,6 +443,8 @@ class PlantCatalog:
                 user.email = cleaned_email
                 user.email_verified = False
                 user.verification_token = _generate_token()
+                # Bump now: a later password check can still raise after this change.
+                self._users_version += 1
                 self._queue_verification_email(user)
                 updated = True
         if display_name is not None:
@@ -428,6 +461,7 @@ class PlantCatalog:
                 updated = True
         if updated:
             user.updated_at = _now()
+            self._users_version += 1
         return user
 
     def get_user_preferences(self, user_id: str) -> dict[str, object]:
@@ -448,6 +482,7 @@ class PlantCatalog:
         else:
             user.preferences.update(sanitized)
         user.updated_at = _now()
+        self._users_version += 1
         return dict(user.preferences)
 
     def remove_user(self, user_id: str) -> None:
@@ -460,30 +495,33 @@ class PlantCatalog:
         if any(record.owner_user_id == user_id for record in self._records):
             raise CatalogError("User still owns plant records")
         user = self._users.pop(user_id)
+        del self._user_ids[bisect_left(self._user_ids, user_id)]
+        self._users_version += 1
         if user.google_sub:
             self._users_by_google_sub.pop(user.google_sub, None)
         if user.apple_sub:
             self._users_by_apple_sub.pop(user.apple_sub, None)
         self._verification_outbox = [entry for entry in self._verification_outbox if entry[0] != user.email]
         impacted: set[str] = {user_id}
-        to_remove = [
-            share_id
-            for share_id, share in self._shares.items()
-            if share.owner_id == user_id or share.contractor_id == user_id
-        ]
-        for share_id in to_remove:
-            share = self._shares.pop(share_id)
+        for share in list(self._shares_by_user.get(user_id, {}).values()):
+            self._unindex_share(share)
             impacted.add(share.owner_id)
             impacted.add(share.contractor_id)
         self._invalidate_share_cache(*impacted)
 
     def list_shares(self, user_id: str) -> list[ShareRecord]:
         self._ensure_user(user_id)
-        return [
-            share
-            for share in self._shares.values()
-            if share.owner_id == user_id or share.contractor_id == user_id
-        ]
+        return list(self._shares_by_user.get(user_id, {}).values())
+
+    def list_shares_page(self, user_id: str, *, after: str | None = None, limit: int = 100) -> list[ShareRecord]:
+        """Return up to ``limit`` of a user's shares ordered by id, starting after ``after``."""
+        self._ensure_user(user_id)
+        # Only the participant's own shares are ordered, so this scales with
+        # that user's share count rather than the whole catalog.
+        shares = self._shares_by_user.get(user_id, {})
+        share_ids = sorted(shares)
+        start = bisect_right(share_ids, after) if after is not None else 0
+        return [shares[share_id] for share_id in share_ids[start : start + limit]]
 
     def add_share(
         self,
@@ -510,7 +548,7 @@ class PlantCatalog:
             created_at=now,
             updated_at=now,
         )
-        self._shares[share_id] = share
+        self._index_share(share)
         self._invalidate_share_cache(owner_id, contractor_id)
         return share
 
@@ -520,10 +558,13 @@ class PlantCatalog:
         *,
         status: ShareStatus | None = None,
         role: ShareRole | None = None,
+        acting_user_id: str | None = None,
     ) -> ShareRecord:
         share = self._shares.get(share_id)
         if share is None:
             raise CatalogNotFoundError(f"Share {share_id!r} not found")
+        if acting_user_id is not None and share.owner_id != acting_user_id:
+            raise CatalogPermissionError("Only owners can update shares")
         if status is not None:
             share.status = status
         if role is not None:
@@ -532,10 +573,13 @@ class PlantCatalog:
         self._invalidate_share_cache(share.owner_id, share.contractor_id)
         return share
 
-    def remove_share(self, share_id: str) -> None:
-        share = self._shares.pop(share_id, None)
+    def remove_share(self, share_id: str, *, acting_user_id: str | None = None) -> None:
+        share = self._shares.get(share_id)
         if share is None:
             raise CatalogNotFoundError(f"Share {share_id!r} not found")
+        if acting_user_id is not None and share.owner_id != acting_user_id:
+            raise CatalogPermissionError("Only owners can delete shares")
+        self._unindex_share(share)
         self._invalidate_share_cache(share.owner_id, share.contractor_id)
 
     def get_share(self, share_id: str) -> ShareRecord | None:
@@ -604,6 +648,7 @@ class PlantCatalog:
             description=(description if description is not None else zone.description) or "",
         )
         self._zones[index] = updated
+        self._version += 1
         return updated
 
     def remove_zone(self, requester_id: str, zone_id: str) -> IrrigationZone:
@@ -613,6 +658,7 @@ class PlantCatalog:
         for record in self._records:
             if record.irrigation_zone_id == zone_id:
                 record.irrigation_zone_id = None
+        self._version += 1
         return removed
 
     def detect_pot(self, requester_id: str) -> PotModel:
@@ -622,15 +668,36 @@ class PlantCatalog:
         index = (self._next_id - 1) % len(models)
         return models[index]
 
+    @property
+    def references_version(self) -> int:
+        return self._references_version
+
+    @property
+    def users_version(self) -> int:
+        """Counter bumped whenever a user account is added, changed or removed."""
+        return self._users_version
+
+    @property
+    def version(self) -> int:
+        """Counter bumped whenever users, shares, zones or plant records change."""
+        return self._version
+
     def search_references(self, query: Optional[str] = None) -> list[PlantReference]:
         if not query:
             return list(self._references)
         lowered = query.strip().lower()
-        return [
-            ref
-            for ref in self._references
-            if lowered in ref.species.lower() or lowered in ref.common_name.lower()
-        ]
+        matches = self._reference_matches.get(lowered)
+        if matches is None:
+            # References only change on reset(), so each distinct query is scanned once.
+            matches = tuple(
+                ref
+                for ref in self._references
+                if lowered in ref.species.lower() or lowered in ref.common_name.lower()
+            )
+            if len(self._reference_matches) >= _REFERENCE_MATCH_CACHE_SIZE:
+                self._reference_matches.clear()
+            self._reference_matches[lowered] = matches
+        return list(matches)
 
     def resolve_reference(self, species: str) -> PlantReference | None:
         lowered = species.lower()
@@ -707,6 +774,7 @@ class PlantCatalog:
         )
         self._records.append(record)
         self._next_id += 1
+        self._version += 1
         return record
 
     def list_records(self, requester_id: str) -> list[PlantRecord]:
@@ -716,7 +784,7 @@ class PlantCatalog:
     def role_for(self, viewer_id: str, owner_id: str) -> ShareRole:
         if viewer_id == owner_id:
             return ShareRole.OWNER
-        for share in self._shares.values():
+        for share in self._shares_by_user.get(viewer_id, {}).values():
             if share.status != ShareStatus.ACTIVE:
                 continue
             if share.owner_id == owner_id and share.contractor_id == viewer_id:
@@ -791,7 +859,27 @@ class PlantCatalog:
             user.updated_at = _now()
         return user
 
+    def _insert_user(self, user: UserAccount) -> None:
+        self._users[user.id] = user
+        insort(self._user_ids, user.id)
+
+    def _index_share(self, share: ShareRecord) -> None:
+        self._shares[share.id] = share
+        self._shares_by_user.setdefault(share.owner_id, {})[share.id] = share
+        self._shares_by_user.setdefault(share.contractor_id, {})[share.id] = share
+
+    def _unindex_share(self, share: ShareRecord) -> None:
+        self._shares.pop(share.id, None)
+        for participant_id in (share.owner_id, share.contractor_id):
+            participant_shares = self._shares_by_user.get(participant_id)
+            if participant_shares is None:
+                continue
+            participant_shares.pop(share.id, None)
+            if not participant_shares:
+                del self._shares_by_user[participant_id]
+
     def _invalidate_share_cache(self, *user_ids: str) -> None:
+        self._version += 1
         if not user_ids:
             self._share_cache.clear()
             return
@@ -804,12 +892,8 @@ class PlantCatalog:
         if cached is not None:
             return set(cached)
         owners = {user_id}
-        for share in self._shares.values():
-            if share.status != ShareStatus.ACTIVE:
-                continue
-            if share.contractor_id == user_id:
-                owners.add(share.owner_id)
-            if share.owner_id == user_id:
+        for share in self._shares_by_user.get(user_id, {}).values():
+            if share.status == ShareStatus.ACTIVE and share.contractor_id == user_id:
                 owners.add(share.owner_id)
         self._share_cache[user_id] = set(owners)
         return set(owners)
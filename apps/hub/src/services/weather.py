@@ -542,7 +542,8 @@ class WeatherService:
         if not value:
             return None
         try:
-            return datetime.fromisoformat(value.replace("Z", "+00:00"))
+            # Python 3.11+ parses the trailing "Z" natively.
+            return datetime.fromisoformat(value)
         except ValueError:
             return None
 
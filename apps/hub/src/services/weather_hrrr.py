@@ -10,7 +10,7 @@ from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
 
 import httpx
 
@@ -95,8 +95,7 @@ def _parse_iso(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
     try:
-        cleaned = value.replace("Z", "+00:00")
-        return datetime.fromisoformat(cleaned).astimezone(timezone.utc)
+        return datetime.fromisoformat(value).astimezone(timezone.utc)
     except Exception:  # pragma: no cover - defensive parsing
         return None
 
@@ -259,6 +258,30 @@ def compute_target_run(
     return HrrrRun(cycle=cycle_candidate, forecast_hour=forecast_hour)
 
 
+def iter_cache_files(root: Path) -> Iterator[Tuple[str, os.stat_result]]:
+    """Yield ``(path, stat)`` for every regular file below ``root``.
+
+    ``os.scandir`` answers the file/directory checks from the directory entry,
+    so each file costs one ``stat`` call instead of the two made by
+    ``Path.is_file`` followed by ``Path.stat``. Unreadable entries are skipped.
+    """
+    pending = [os.fspath(root)]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as iterator:
+                for entry in iterator:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            yield entry.path, entry.stat()
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
 class HrrrWeatherService:
     def __init__(
         self,
@@ -788,5 +811,6 @@ __all__ = [
     "HrrrDependencyError",
     "compute_target_run",
     "hrrr_weather_service",
+    "iter_cache_files",
 ]
 
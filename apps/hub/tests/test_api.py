@@ -1,6 +1,15 @@
-
+import asyncio
+import base64
+import json
+import time
+
+import pytest
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
 from fastapi.testclient import TestClient
+from httpx import Response
 
+from auth import apple
 from auth.jwt import verify_access_token
 from config import settings
 
@@ -114,7 +123,7 @@ def test_apple_sign_in_creates_user_and_issues_token(client: TestClient, setting
         apple_oauth_client_ids=["com.projectplant.web"],
     )
 
-    def _fake_verify(token: str, *, allowed_client_ids) -> AppleIdentity:
+    async def _fake_verify(token: str, *, allowed_client_ids) -> AppleIdentity:
         assert token == "apple-id-token"
         assert allowed_client_ids == ["com.projectplant.web"]
         return AppleIdentity(
@@ -137,6 +146,58 @@ def test_apple_sign_in_creates_user_and_issues_token(client: TestClient, setting
     assert verify_access_token(payload["access_token"]) == payload["user"]["id"]
 
 
+@pytest.mark.anyio
+async def test_apple_keys_are_decoded_once_per_fetch(monkeypatch, respx_mock) -> None:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    numbers = private_key.public_key().public_numbers()
+
+    def _b64(raw: bytes) -> str:
+        return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+    def _b64_int(value: int) -> str:
+        return _b64(value.to_bytes((value.bit_length() + 7) // 8, "big"))
+
+    route = respx_mock.get(apple.APPLE_JWKS_URL).mock(
+        return_value=Response(
+            200,
+            json={
+                "keys": [
+                    {"kid": "rsa-key", "kty": "RSA", "n": _b64_int(numbers.n), "e": _b64_int(numbers.e)},
+                    {"kid": "ec-key", "kty": "EC"},
+                ]
+            },
+        )
+    )
+    monkeypatch.setattr(apple, "_APPLE_JWKS_CACHE", None)
+    monkeypatch.setattr(apple, "_APPLE_HTTP_CLIENT", None)
+
+    keys, concurrent = await asyncio.gather(apple._fetch_apple_keys(), apple._fetch_apple_keys())
+    assert concurrent is keys
+    assert list(keys) == ["rsa-key"]
+    assert keys["rsa-key"].public_numbers() == numbers
+    assert await apple._fetch_apple_keys() is keys
+    assert route.call_count == 1
+
+    header = _b64(json.dumps({"alg": "RS256", "kid": "rsa-key"}).encode("utf-8"))
+    claims = {
+        "iss": apple.APPLE_ISSUER,
+        "aud": "com.projectplant.web",
+        "exp": int(time.time()) + 600,
+        "sub": "apple-sub-1",
+    }
+    payload = _b64(json.dumps(claims).encode("utf-8"))
+    signature = private_key.sign(f"{header}.{payload}".encode("ascii"), padding.PKCS1v15(), hashes.SHA256())
+    token = f"{header}.{payload}.{_b64(signature)}"
+
+    identity = await apple.verify_apple_id_token(token, allowed_client_ids=["com.projectplant.web"])
+    assert identity.subject == "apple-sub-1"
+    with pytest.raises(apple.AppleIdentityError, match="signature"):
+        await apple.verify_apple_id_token(token[:-4] + "AAAA", allowed_client_ids=["com.projectplant.web"])
+    assert apple._APPLE_HTTP_CLIENT is not None
+    await apple.close_apple_http_client()
+    assert apple._APPLE_HTTP_CLIENT is None
+
+
 def test_etkc_metrics_endpoint(client: TestClient) -> None:
     response = client.get("/api/v1/etkc/metrics/test-pot")
     assert response.status_code == 200
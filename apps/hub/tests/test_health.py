@@ -68,6 +68,28 @@ def test_health_weather_cache_stats(settings_override, tmp_path):
     assert payload["bytes"] == size
 
 
+def test_health_weather_cache_entries_walk_nested_dirs(settings_override, tmp_path):
+    cache_dir = tmp_path / "hrrr"
+    grib = cache_dir / "hrrr.20251028" / "conus" / "hrrr.t14z.wrfsfcf02.grib2"
+    grib.parent.mkdir(parents=True)
+    grib.write_bytes(b"data")
+    grib.with_suffix(".grib2.json").write_text('{"cycle": "2025-10-28T14:00:00Z", "forecast_hour": 2}')
+
+    settings_override(hrrr_cache_dir=str(cache_dir), mqtt_enabled=False)
+
+    with _build_client() as client:
+        response = client.get("/api/v1/health/weather_cache/entries", params={"order": "largest", "kind": "grib"})
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["total_files"] == 2
+    assert [entry["path"] for entry in payload["entries"]] == [
+        os.path.join("hrrr.20251028", "conus", "hrrr.t14z.wrfsfcf02.grib2")
+    ]
+    assert payload["entries"][0]["has_metadata"] is True
+    assert payload["entries"][0]["forecast_hour"] == 2
+
+
 def test_health_events_endpoint_returns_alerts(settings_override):
     settings_override(mqtt_enabled=False)
     asyncio.run(
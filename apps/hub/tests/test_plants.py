@@ -39,6 +39,20 @@ def test_reference_search(client: TestClient) -> None:
     assert "light" in entry
 
 
+def test_reference_list_supports_etag(client: TestClient) -> None:
+    response = client.get("/api/v1/plants/reference")
+    assert response.status_code == 200
+    assert response.json()
+    etag = response.headers["etag"]
+
+    cached = client.get("/api/v1/plants/reference", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+    filtered = client.get("/api/v1/plants/reference", params={"search": "monstera"})
+    assert filtered.headers["etag"] != etag
+
+
 def test_suggest_plants_remote_and_local(
     client: TestClient, respx_mock
 ) -> None:
@@ -275,6 +289,25 @@ def test_create_garden_plant_with_zone(client: TestClient) -> None:
     assert body["ideal_conditions"]["temperature_c"] == [18.0, 30.0]
 
 
+def test_plant_responses_encode_nan_as_null(client: TestClient) -> None:
+    # Starlette's json.loads accepts NaN, so it can reach the care profile.
+    body = (
+        '{"nickname": "Boston Fern", "species": "Nephrolepis exaltata", "location_type": "garden",'
+        ' "care_profile": {"light": "Indirect", "water": "Weekly", "humidity": "High",'
+        ' "temperature_c": [NaN, 26], "ph_range": [5.5, 6.5]}}'
+    )
+    created = client.post("/api/v1/plants", content=body, headers={"Content-Type": "application/json"})
+    assert created.status_code == 201
+    assert b"NaN" not in created.content
+    assert created.json()["ideal_conditions"]["temperature_c"] == [None, 26.0]
+
+    listing = client.get("/api/v1/plants")
+    assert listing.status_code == 200
+    assert b"NaN" not in listing.content
+    fern = next(item for item in listing.json() if item["nickname"] == "Boston Fern")
+    assert fern["ideal_conditions"]["temperature_c"] == [None, 26.0]
+
+
 def test_create_irrigation_zone(client: TestClient) -> None:
     payload = {
         "name": "Back patio planters",
@@ -315,6 +348,7 @@ def test_update_irrigation_zone(client: TestClient) -> None:
     )
     assert created.status_code == 201
     zone_id = created.json()["id"]
+    assert any(item["id"] == zone_id for item in client.get("/api/v1/plants/zones").json())
 
     updated = client.put(
         f"/api/v1/plants/zones/{zone_id}",
@@ -338,6 +372,44 @@ def test_update_irrigation_zone(client: TestClient) -> None:
     assert payload["coverage_sq_ft"] == 72
     assert payload["description"].startswith("Converted")
 
+    listing = client.get("/api/v1/plants/zones").json()
+    listed = next(item for item in listing if item["id"] == zone_id)
+    assert listed["name"] == "Veggie beds north"
+
+
+def test_zone_listing_etag_tracks_catalog_changes(client: TestClient) -> None:
+    first = client.get("/api/v1/plants/zones")
+    etag = first.headers["etag"]
+    assert client.get("/api/v1/plants/zones", headers={"If-None-Match": etag}).status_code == 304
+
+    created = client.post(
+        "/api/v1/plants/zones",
+        json={
+            "name": "Side yard",
+            "irrigation_type": "spray",
+            "sun_exposure": "shade",
+            "slope": False,
+            "planting_type": "lawn",
+        },
+    )
+    assert created.status_code == 201
+
+    refreshed = client.get("/api/v1/plants/zones", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+    assert any(item["id"] == created.json()["id"] for item in refreshed.json())
+
+
+def test_zone_listing_etag_changes_across_restarts(client: TestClient, monkeypatch) -> None:
+    from api.v1 import plant_router
+
+    etag = client.get("/api/v1/plants/zones").headers["etag"]
+    # A restarted hub reuses catalog version numbers but draws a new boot id.
+    monkeypatch.setattr(plant_router, "_ETAG_BOOT_ID", "restarted")
+    replayed = client.get("/api/v1/plants/zones", headers={"If-None-Match": etag})
+    assert replayed.status_code == 200
+    assert replayed.headers["etag"] != etag
+
 
 def test_delete_irrigation_zone_clears_plants(client: TestClient) -> None:
     zone = client.post(
@@ -373,3 +445,33 @@ def test_delete_irrigation_zone_clears_plants(client: TestClient) -> None:
     plants_after = client.get("/api/v1/plants").json()
     garden = next(item for item in plants_after if item["nickname"] == "Apple row")
     assert garden["irrigation_zone_id"] is None
+
+
+def test_conversion_helpers_populate_every_model_field() -> None:
+    from api.v1 import plant_router
+    from services.plants import ShareRole, plant_catalog
+
+    owner_id = "user-demo-owner"
+    record = plant_catalog.add_record(
+        owner_id,
+        nickname="Field check",
+        species="Monstera deliciosa",
+        location_type="garden",
+        pot_model=None,
+        irrigation_zone_id=None,
+        image_data=None,
+    )
+    converted = [
+        plant_router._to_reference_model(plant_catalog.search_references()[0]),
+        plant_router._to_pot_model(plant_catalog.list_pot_models(owner_id)[0], ShareRole.OWNER),
+        plant_router._to_zone_model(plant_catalog.list_zones(owner_id)[0], ShareRole.OWNER),
+    ]
+    for model in converted:
+        # model_construct skips validation, so a field added to a response model
+        # without updating its helper would otherwise go unnoticed.
+        assert model.model_fields_set == set(type(model).model_fields)
+
+    payload = plant_router._plant_payload(record, ShareRole.OWNER)
+    assert list(payload) == list(plant_router.PlantResponse.model_fields)
+    assert list(payload["ideal_conditions"]) == list(plant_router.CareProfileModel.model_fields)
+    plant_router.PlantResponse.model_validate(payload)
@@ -2,9 +2,9 @@ import asyncio
 import time
 
 import pytest
-from fastapi import HTTPException
+from pydantic import ValidationError
 
-from api.v1.provision_router import ProvisionWaitRequest, provision_wait
+from api.v1.provision_router import ProvisionWaitRequest, ProvisionWaitResponse, provision_wait
 from services.provisioning import normalize_device_id, provisioning_store
 
 
@@ -50,7 +50,7 @@ async def test_provision_wait_timeout() -> None:
     await provisioning_store.clear()
     request = ProvisionWaitRequest(timeout=0.6, require_fresh=True)
     start = time.time()
-    response = await provision_wait(request)
+    response = ProvisionWaitResponse.model_validate_json((await provision_wait(request)).body)
     elapsed = time.time() - start
     assert response.status == "timeout"
     assert response.device is None
@@ -73,7 +73,7 @@ async def test_provision_wait_returns_device() -> None:
 
     trigger = asyncio.create_task(_trigger_state())
     request = ProvisionWaitRequest(timeout=1.5, require_fresh=True, device_id="11:22:33:44:55:66", method="BLE")
-    response = await provision_wait(request)
+    response = ProvisionWaitResponse.model_validate_json((await provision_wait(request)).body)
     await trigger
 
     assert response.status == "online"
@@ -84,10 +84,7 @@ async def test_provision_wait_returns_device() -> None:
     assert response.method == "ble"
 
 
-@pytest.mark.anyio
-async def test_provision_wait_rejects_invalid_device() -> None:
-    await provisioning_store.clear()
-    request = ProvisionWaitRequest(timeout=0.6, require_fresh=True, device_id="bad")
-    with pytest.raises(HTTPException) as excinfo:
-        await provision_wait(request)
-    assert excinfo.value.status_code == 422
+def test_provision_wait_rejects_invalid_device() -> None:
+    with pytest.raises(ValidationError) as excinfo:
+        ProvisionWaitRequest(timeout=0.6, require_fresh=True, device_id="bad")
+    assert "12-digit hexadecimal" in str(excinfo.value)
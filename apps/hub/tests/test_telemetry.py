@@ -212,6 +212,30 @@ def test_export_pot_telemetry_csv(client, tmp_path):
         assert rows[0]["moisture_pct"] == "61.2"
 
 
+def test_export_csv_rows_match_csv_module_quoting():
+    from api.v1.telemetry_router import CSV_FIELDNAMES, _iter_csv_bytes
+
+    samples = [
+        {
+            "potId": "pot,1",
+            "timestamp": 'say "hi"',
+            "moisture_pct": 42.5,
+            "valve_open": True,
+            "soilRaw": 512,
+            "source": "multi\nline",
+            "requestId": None,
+        }
+    ] * 300
+    expected = io.StringIO()
+    writer = csv.DictWriter(expected, fieldnames=CSV_FIELDNAMES, extrasaction="ignore")
+    writer.writeheader()
+    for sample in samples:
+        writer.writerow(sample)
+
+    rows = [tuple(sample.get(field) for field in CSV_FIELDNAMES) for sample in samples]
+    assert b"".join(_iter_csv_bytes(rows)) == expected.getvalue().encode("utf-8")
+
+
 def test_export_pot_telemetry_csv_gzip(client, tmp_path):
     with _override_pot_store(tmp_path, "pot-export-gzip.sqlite", retention_hours=72, max_rows=500) as test_store:
         asyncio.run(
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import json
+
 from fastapi.testclient import TestClient
 
+from api.v1.user_router import ShareModel, UserModel, _share_json, _user_json
 from auth.jwt import create_access_token
-from services.plants import plant_catalog
+from services.plants import ShareRole, ShareStatus, plant_catalog
 
 
 def test_list_users_and_me(client: TestClient) -> None:
@@ -33,6 +36,21 @@ def test_get_me_with_bearer_token(client: TestClient) -> None:
     assert response.json()["id"] == "user-demo-owner"
 
 
+def test_cached_user_payload_reflects_profile_edits(client: TestClient) -> None:
+    before = client.get("/api/v1/users/me")
+    assert before.status_code == 200
+    original_name = before.json()["display_name"]
+
+    renamed = client.patch("/api/v1/users/user-demo-owner", json={"display_name": "Renamed Grower"})
+    assert renamed.status_code == 200
+
+    after = client.get("/api/v1/users/me")
+    assert after.json()["display_name"] == "Renamed Grower"
+    listed = client.get("/api/v1/users").json()
+    assert next(user for user in listed if user["id"] == "user-demo-owner")["display_name"] == "Renamed Grower"
+    assert original_name != "Renamed Grower"
+
+
 def test_preferences_lifecycle(client: TestClient) -> None:
     initial = client.get("/api/v1/users/me/preferences")
     assert initial.status_code == 200
@@ -74,6 +92,20 @@ def test_preferences_lifecycle(client: TestClient) -> None:
     assert replaced.json()["values"] == {"units": "imperial"}
 
 
+def test_preferences_encode_nan_as_null(client: TestClient) -> None:
+    updated = client.put(
+        "/api/v1/users/me/preferences",
+        content='{"values": {"t": NaN}}',
+        headers={"Content-Type": "application/json"},
+    )
+    assert updated.status_code == 200
+    assert updated.content == b'{"values":{"t":null}}'
+
+    fetched = client.get("/api/v1/users/me/preferences")
+    assert fetched.status_code == 200
+    assert fetched.content == b'{"values":{"t":null}}'
+
+
 def test_create_update_delete_user(client: TestClient) -> None:
     initial_outbox = len(plant_catalog.list_verification_outbox())
     created = client.post(
@@ -162,3 +194,167 @@ def test_share_lifecycle(client: TestClient) -> None:
 
     removed = client.delete(f"/api/v1/users/me/shares/{share_id}")
     assert removed.status_code == 204
+
+
+def test_removing_user_drops_shares_from_counterpart_listing() -> None:
+    contractor = plant_catalog.add_user(
+        email="index-check@example.com",
+        display_name="Index Check",
+        password="supersecure123",
+        require_verification=False,
+    )
+    share = plant_catalog.add_share(
+        owner_id="user-demo-owner",
+        contractor_id=contractor.id,
+        role=ShareRole.CONTRACTOR,
+        status=ShareStatus.ACTIVE,
+    )
+    assert share.id in {item.id for item in plant_catalog.list_shares("user-demo-owner")}
+    assert plant_catalog.role_for(contractor.id, "user-demo-owner") == ShareRole.CONTRACTOR
+
+    plant_catalog.remove_user(contractor.id)
+
+    assert share.id not in {item.id for item in plant_catalog.list_shares("user-demo-owner")}
+    assert plant_catalog.get_share(share.id) is None
+
+
+def test_create_user_rejects_malformed_email(client: TestClient) -> None:
+    response = client.post(
+        "/api/v1/users",
+        json={
+            "email": "not-an-email",
+            "display_name": "Nope",
+            "password": "supersecure123",
+            "confirm_password": "supersecure123",
+        },
+    )
+    assert response.status_code == 422
+
+    for email in ("a@b..com", "a@.example.com", "a@example.com."):
+        response = client.post(
+            "/api/v1/users",
+            json={
+                "email": email,
+                "display_name": "Nope",
+                "password": "supersecure123",
+                "confirm_password": "supersecure123",
+            },
+        )
+        assert response.status_code == 422, email
+
+
+def test_password_mismatch_returns_bad_request(client: TestClient) -> None:
+    created = client.post(
+        "/api/v1/users",
+        json={
+            "email": "mismatch@example.com",
+            "password": "supersecure123",
+            "confirm_password": "supersecure124",
+        },
+    )
+    assert created.status_code == 400
+    assert created.json() == {"detail": "Passwords do not match"}
+
+    updated = client.patch("/api/v1/users/user-demo-owner", json={"password": "newsecurepass1"})
+    assert updated.status_code == 400
+    assert updated.json() == {"detail": "Passwords do not match"}
+
+
+def test_encoded_payloads_match_response_models() -> None:
+    user = plant_catalog.get_user("user-demo-owner")
+    assert user is not None
+    user_payload = json.loads(_user_json(user))
+    assert list(user_payload) == list(UserModel.model_fields)
+    UserModel.model_validate(user_payload)
+
+    share = plant_catalog.list_shares("user-demo-owner")[0]
+    share_payload = json.loads(_share_json(share, "user-demo-owner"))
+    assert list(share_payload) == list(ShareModel.model_fields)
+    assert ShareModel.model_validate(share_payload).participant_role == "owner"
+
+
+def test_create_share_with_unknown_contractor_returns_404(client: TestClient) -> None:
+    response = client.post("/api/v1/users/me/shares", json={"contractor_id": "user-missing"})
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Contractor user not found"
+
+
+def test_list_users_paginates_by_id_cursor(client: TestClient) -> None:
+    created_ids: list[str] = []
+    for index in range(3):
+        created_ids.append(
+            plant_catalog.add_user(
+                email=f"page-{index}@example.com",
+                display_name=f"Page {index}",
+                password="supersecure123",
+                require_verification=False,
+            ).id
+        )
+    expected = sorted(user.id for user in plant_catalog.list_users())
+
+    first = client.get("/api/v1/users", params={"limit": 2})
+    assert first.status_code == 200
+    first_ids = [user["id"] for user in first.json()]
+    assert first_ids == expected[:2]
+
+    rest = client.get("/api/v1/users", params={"after": first_ids[-1], "limit": 500})
+    assert [user["id"] for user in rest.json()] == expected[2:]
+
+    plant_catalog.update_user(expected[0], display_name="Paged Rename")
+    refreshed = client.get("/api/v1/users", params={"limit": 2}).json()
+    assert refreshed[0]["display_name"] == "Paged Rename"
+
+    unpaged = client.get("/api/v1/users")
+    assert [user["id"] for user in unpaged.json()] == [user.id for user in plant_catalog.list_users()]
+
+    plant_catalog.remove_user(created_ids[0])
+    after_removal = client.get("/api/v1/users", params={"limit": 500}).json()
+    assert [user["id"] for user in after_removal] == [user_id for user_id in expected if user_id != created_ids[0]]
+
+
+def test_list_my_shares_paginates_by_id_cursor(client: TestClient) -> None:
+    for index in range(3):
+        contractor = plant_catalog.add_user(
+            email=f"share-page-{index}@example.com",
+            display_name=f"Share Page {index}",
+            password="supersecure123",
+            require_verification=False,
+        )
+        plant_catalog.add_share(
+            owner_id="user-demo-owner",
+            contractor_id=contractor.id,
+            role=ShareRole.CONTRACTOR,
+            status=ShareStatus.ACTIVE,
+        )
+    expected = sorted(share.id for share in plant_catalog.list_shares("user-demo-owner"))
+
+    unpaged = client.get("/api/v1/users/me/shares")
+    assert len(unpaged.json()) == len(expected)
+
+    first = client.get("/api/v1/users/me/shares", params={"limit": 2})
+    first_ids = [share["id"] for share in first.json()]
+    assert first_ids == expected[:2]
+
+    rest = client.get("/api/v1/users/me/shares", params={"after": first_ids[-1]})
+    assert [share["id"] for share in rest.json()] == expected[2:]
+
+
+def test_get_user_by_id_tracks_account_changes(client: TestClient) -> None:
+    missing = client.get("/api/v1/users/user-later")
+    assert missing.status_code == 404
+
+    created = plant_catalog.add_user(
+        email="profile-view@example.com",
+        display_name="Profile View",
+        password="supersecure123",
+        require_verification=False,
+    )
+    first = client.get(f"/api/v1/users/{created.id}")
+    assert first.status_code == 200
+    assert first.json()["display_name"] == "Profile View"
+
+    plant_catalog.update_user(created.id, display_name="Profile Viewed")
+    assert client.get(f"/api/v1/users/{created.id}").json()["display_name"] == "Profile Viewed"
+
+    plant_catalog.remove_user(created.id)
+    assert client.get(f"/api/v1/users/{created.id}").status_code == 404
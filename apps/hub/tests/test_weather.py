@@ -1,4 +1,9 @@
+import asyncio
+import json
+import os
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 from fastapi.testclient import TestClient
@@ -61,6 +66,12 @@ def _ensure_hrrr_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr(weather_router.settings, "hrrr_enabled", True)
 
 
+@pytest.fixture(autouse=True)
+def _clear_router_caches() -> None:
+    weather_router._HISTORY_SAMPLES.clear()
+    weather_router._STATUS_CACHE.clear()
+
+
 def test_weather_endpoint_returns_hrrr_series(
     monkeypatch: pytest.MonkeyPatch,
     client: TestClient,
@@ -171,3 +182,327 @@ def test_weather_endpoint_uses_station_when_hrrr_disabled(
     assert payload["station"]["identifier"] == "KDCA"
     assert payload["sources"] == ["noaa_nws"]
     assert payload["requested_hours"] == pytest.approx(1.0)
+
+
+def test_hrrr_routes_return_404_when_disabled(
+    monkeypatch: pytest.MonkeyPatch,
+    client: TestClient,
+) -> None:
+    monkeypatch.setattr(weather_router.settings, "hrrr_enabled", False)
+
+    for method, path in (("get", "/api/v1/weather/hrrr/health"), ("post", "/api/v1/weather/hrrr/refresh")):
+        response = client.request(method.upper(), path)
+        assert response.status_code == 404
+        assert response.json()["detail"] == "HRRR integration is disabled"
+
+
+@pytest.mark.anyio
+async def test_collect_hrrr_series_fetches_history_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    reference = datetime(2025, 10, 28, 16, 0, tzinfo=timezone.utc)
+    seed = _build_sample(reference)
+    in_flight = 0
+    peak = 0
+
+    class _HistoryStub:
+        async def refresh_point(self, lat, lon, *, when=None, persist=False):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if when is not None and when.hour == 3:
+                raise HrrrDataUnavailable("missing 03z")
+            return _build_sample(when)
+
+    monkeypatch.setattr(weather_router, "hrrr_weather_service", _HistoryStub())
+    entries, error = await weather_router._collect_hrrr_series(38.9, -77.0, 6, seed_sample=seed)
+
+    timestamps = [entry.timestamp for entry in entries]
+    assert timestamps == sorted(timestamps)
+    assert timestamps[-1] == weather_router._format_timestamp(reference)
+    expected_hours = [reference - timedelta(hours=offset) for offset in range(weather_router.MAX_HRRR_HISTORY_HOURS)]
+    assert len(entries) == sum(1 for target in expected_hours if target.hour != 3)
+    assert error == "missing 03z"
+    assert 1 < peak <= weather_router.HRRR_HISTORY_CONCURRENCY
+
+
+def test_cache_scans_walk_nested_files(tmp_path) -> None:
+    grib = tmp_path / "hrrr.20251028" / "conus" / "hrrr.t14z.wrfsfcf02.grib2"
+    grib.parent.mkdir(parents=True)
+    grib.write_bytes(b"x" * 10)
+    grib.with_suffix(".grib2.json").write_text("{}")
+    (tmp_path / "fetch_log.jsonl").write_text("{}\n")
+
+    summary = weather_router._scan_cache_summary(tmp_path)
+    assert summary["total_files"] == 3
+    assert summary["total_bytes"] == 10 + 2 + 3
+
+    scanned = weather_router._scan_cache_dir(tmp_path)
+    assert scanned.total_files == 3
+    assert sorted(scanned.sizes) == [2, 3, 10]
+    assert scanned.sidecars == {str(grib.with_suffix(".grib2.json").resolve())}
+
+    collected = weather_router._collect_cache_entries(tmp_path, "largest", 10)
+    by_path = {entry.path: entry for entry in collected["entries"]}
+    assert set(by_path) == {
+        "hrrr.20251028/conus/hrrr.t14z.wrfsfcf02.grib2",
+        "hrrr.20251028/conus/hrrr.t14z.wrfsfcf02.grib2.json",
+        "fetch_log.jsonl",
+    }
+    grib_entry = by_path["hrrr.20251028/conus/hrrr.t14z.wrfsfcf02.grib2"]
+    assert grib_entry.kind == "grib"
+    assert grib_entry.has_metadata is True
+    assert grib_entry.forecast_hour == 2
+    assert by_path["fetch_log.jsonl"].kind == "log"
+
+
+def test_marshal_hrrr_sample_reuses_snapshot_for_same_sample() -> None:
+    sample = _build_sample()
+    first = weather_router._marshal_hrrr_sample(38.9, -77.0, sample, persisted=None)
+    assert weather_router._marshal_hrrr_sample(38.9, -77.0, sample, persisted=None) is first
+    assert weather_router._marshal_hrrr_sample(38.9, -77.0, sample, persisted=True) is not first
+
+    replacement = _build_sample()
+    rebuilt = weather_router._marshal_hrrr_sample(38.9, -77.0, replacement, persisted=None)
+    assert rebuilt is not first
+    assert rebuilt.model_dump() == first.model_dump()
+
+
+@pytest.mark.anyio
+async def test_historical_samples_are_reused_until_expiry(monkeypatch: pytest.MonkeyPatch) -> None:
+    when = datetime(2025, 10, 28, 12, 0, tzinfo=timezone.utc)
+    stub = _StubHrrrService(sample=_build_sample(when))
+    monkeypatch.setattr(weather_router, "hrrr_weather_service", stub)
+
+    first = await weather_router._historical_sample(38.90001, -77.0, when)
+    second = await weather_router._historical_sample(38.90002, -77.0, when)
+    assert second is first
+    assert len(stub.refresh_calls) == 1
+
+    key = next(iter(weather_router._HISTORY_SAMPLES))
+    weather_router._HISTORY_SAMPLES[key] = (0.0, first)
+    await weather_router._historical_sample(38.9, -77.0, when)
+    assert len(stub.refresh_calls) == 2
+
+
+def test_coverage_hours_spans_unordered_timestamps() -> None:
+    timestamps = ["2025-10-28T12:00:00Z", None, "2025-10-28T06:30:00Z", "bogus", "2025-10-28T09:00:00Z"]
+    assert weather_router._calculate_coverage_hours(timestamps) == 5.5
+    assert weather_router._calculate_coverage_hours(["2025-10-28T12:00:00Z"]) == 0.0
+    assert weather_router._calculate_coverage_hours([]) == 0.0
+
+
+def test_coverage_hours_mixes_canonical_and_offset_timestamps() -> None:
+    timestamps = ["2025-10-28T12:00:00Z", "2025-10-28T15:00:00+00:00", "2025-10-28T10:00:00.500Z"]
+    assert weather_router._calculate_coverage_hours(timestamps) == 5.0
+    assert weather_router._calculate_coverage_hours(["2025-10-28T14:00:00+02:00", "2025-10-28T13:00:00Z"]) == 1.0
+
+
+def test_coverage_hours_ignores_malformed_canonical_extremes() -> None:
+    timestamps = ["2025-10-28T12:00:00Z", "2025-13-01T00:00:00Z", "2025-10-28T06:00:00Z", "0000-00-00T00:00:00Z"]
+    assert weather_router._calculate_coverage_hours(timestamps) == 6.0
+    assert weather_router._calculate_coverage_hours(["2025-13-01T00:00:00Z", "2025-10-28T06:00:00Z"]) == 0.0
+    assert weather_router._calculate_coverage_hours(
+        ["2025-13-01T00:00:00Z", "2025-10-28T06:00:00Z", "2025-10-28T08:30:00+00:00"]
+    ) == 2.5
+
+
+def test_format_timestamp_normalizes_to_utc_seconds() -> None:
+    offset = timezone(timedelta(hours=2))
+    value = datetime(2025, 10, 28, 14, 0, 5, 123456, tzinfo=offset)
+    assert weather_router._format_timestamp(value) == "2025-10-28T12:00:05Z"
+    assert weather_router._format_timestamp(value.astimezone(timezone.utc)) == "2025-10-28T12:00:05Z"
+
+
+def test_collect_cache_entries_orders_and_limits(tmp_path) -> None:
+    for index, size in enumerate([5, 20, 10]):
+        path = tmp_path / f"file{index}.grib2"
+        path.write_bytes(b"x" * size)
+        os.utime(path, (1_700_000_000 + index, 1_700_000_000 + index))
+
+    def paths(order: str) -> list[str]:
+        payload = weather_router._collect_cache_entries(tmp_path, order, 2)
+        return [entry.path for entry in payload["entries"]]
+
+    assert paths("newest") == ["file2.grib2", "file1.grib2"]
+    assert paths("oldest") == ["file0.grib2", "file1.grib2"]
+    assert paths("largest") == ["file1.grib2", "file2.grib2"]
+    assert paths("smallest") == ["file0.grib2", "file2.grib2"]
+
+
+@pytest.mark.anyio
+async def test_hrrr_status_is_cached_per_history_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[int] = []
+
+    async def fake_build(*, history_limit: int):
+        calls.append(history_limit)
+        await asyncio.sleep(0)
+        return weather_router.HrrrStatusResponse.model_construct(
+            enabled=True,
+            scheduler_running=False,
+            refresh_interval_minutes=None,
+            default_location=None,
+            last_refresh=None,
+            last_valid_time=None,
+            cache_dir="cache",
+            domain="conus",
+            cached_points=history_limit,
+        )
+
+    monkeypatch.setattr(weather_router, "_build_hrrr_status_response", fake_build)
+
+    first, second = await asyncio.gather(
+        weather_router._cached_hrrr_status_json(history_limit=10),
+        weather_router._cached_hrrr_status_json(history_limit=10),
+    )
+    assert first is second
+    assert json.loads(first)["cached_points"] == 10
+    other = await weather_router._cached_hrrr_status_json(history_limit=20)
+    assert json.loads(other)["cached_points"] == 20
+    assert calls == [10, 20]
+
+    weather_router._STATUS_CACHE[10] = (0.0, first)
+    refreshed = await weather_router._cached_hrrr_status_json(history_limit=10)
+    assert refreshed is not first
+    assert calls == [10, 20, 10]
+
+
+def test_cache_mutations_keep_request_order(tmp_path) -> None:
+    cache_dir = tmp_path / "cache"
+    archive_dir = tmp_path / "archive"
+    for name in ("a.grib2", "b.grib2", "c.grib2"):
+        path = cache_dir / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * 4)
+    (cache_dir / "a.grib2.json").write_text("{}")
+
+    deleted = weather_router._delete_cache_entries(
+        cache_dir,
+        weather_router.CacheMutationRequest(entries=["a.grib2", "../escape", "b.grib2", "a.grib2"]),
+    )
+    assert [(detail.path, detail.status) for detail in deleted["details"]] == [
+        ("a.grib2", "deleted"),
+        ("a.grib2.json", "deleted"),
+        ("../escape", "invalid"),
+        ("b.grib2", "deleted"),
+        ("b.grib2.json", "missing"),
+        ("a.grib2", "missing"),
+        ("a.grib2.json", "missing"),
+    ]
+    assert deleted["processed"] == 3
+    assert deleted["bytes_removed"] == 4 + 2 + 4
+
+    stored = weather_router._store_cache_entries(
+        cache_dir,
+        archive_dir,
+        weather_router.CacheStoreRequest(entries=["c.grib2"], include_metadata=False, label="keep"),
+    )
+    assert stored["processed"] == 1
+    assert stored["bytes_moved"] == 4
+    assert stored["details"][0].status == "stored"
+    assert stored["details"][0].path.endswith("_keep/c.grib2")
+    assert (archive_dir / stored["details"][0].path).exists()
+    assert not (cache_dir / "c.grib2").exists()
+
+
+def test_resolve_cache_targets_rejects_lexical_escapes(tmp_path) -> None:
+    root = tmp_path.resolve()
+    resolve = weather_router._resolve_cache_targets
+    assert resolve(root, "sub/../a.grib2", include_metadata=True) == [root / "a.grib2", root / "a.grib2.json"]
+    for entry in ("..", "../a.grib2", "sub/../../a.grib2", "  "):
+        with pytest.raises(ValueError):
+            resolve(root, entry, include_metadata=False)
+
+
+def test_telemetry_sort_key_orders_unparseable_first() -> None:
+    entries = [
+        weather_router.WeatherTelemetry(timestamp="2025-10-28T12:00:00Z"),
+        weather_router.WeatherTelemetry(timestamp="not-a-time"),
+        weather_router.WeatherTelemetry(timestamp="2025-10-28T11:00:00Z"),
+    ]
+    ordered = sorted(entries, key=weather_router._telemetry_sort_key)
+    assert [entry.timestamp for entry in ordered] == [
+        "not-a-time",
+        "2025-10-28T11:00:00Z",
+        "2025-10-28T12:00:00Z",
+    ]
+
+
+@pytest.mark.anyio
+async def test_historical_misses_are_remembered(monkeypatch: pytest.MonkeyPatch) -> None:
+    when = datetime(2025, 10, 26, 3, 0, tzinfo=timezone.utc)
+    stub = _StubHrrrService(error=HrrrDataUnavailable("HRRR product not available"))
+    monkeypatch.setattr(weather_router, "hrrr_weather_service", stub)
+
+    for _ in range(2):
+        with pytest.raises(HrrrDataUnavailable, match="not available"):
+            await weather_router._historical_sample(38.9, -77.0, when)
+    assert len(stub.refresh_calls) == 1
+
+
+@pytest.mark.anyio
+async def test_historical_misses_expire_after_short_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    when = datetime(2025, 10, 26, 4, 0, tzinfo=timezone.utc)
+    stub = _StubHrrrService(error=HrrrDataUnavailable("HRRR product not available"))
+    monkeypatch.setattr(weather_router, "hrrr_weather_service", stub)
+    now = [1000.0]
+    monkeypatch.setattr(weather_router, "time", SimpleNamespace(monotonic=lambda: now[0]))
+
+    with pytest.raises(HrrrDataUnavailable):
+        await weather_router._historical_sample(38.9, -77.0, when)
+    now[0] += weather_router.HISTORY_MISS_TTL_SECONDS + 1
+    with pytest.raises(HrrrDataUnavailable):
+        await weather_router._historical_sample(38.9, -77.0, when)
+    assert len(stub.refresh_calls) == 2
+
+
+def test_classify_cache_entry_by_suffix() -> None:
+    classify = weather_router._classify_cache_entry
+    assert classify(Path("hrrr.t14z.wrfsfcf02.GRIB2")) == "grib"
+    assert classify(Path("hrrr.t14z.wrfsfcf02.grib2.json")) == "metadata"
+    assert classify(Path(".json")) == "metadata"
+    assert classify(Path("fetch_log.jsonl")) == "log"
+    assert classify(Path("Download.LOG.txt")) == "log"
+    assert classify(Path("README")) == "other"
+
+
+def test_hrrr_fetch_log_returns_serialized_entries(
+    monkeypatch: pytest.MonkeyPatch,
+    client: TestClient,
+) -> None:
+    entries = [
+        {
+            "timestamp": "2025-10-28T16:00:00Z",
+            "lat": 38.9,
+            "lon": -77.0,
+            "run_cycle": "2025-10-28T14:00:00Z",
+            "forecast_hour": 2,
+            "valid_time": "2025-10-28T16:00:00Z",
+            "status": "ok",
+            "detail": None,
+            "persisted": True,
+            "duration_s": 1.5,
+        }
+    ]
+
+    class _FetchLogService:
+        async def fetch_history(self, *, limit: int):
+            assert limit == 5
+            return entries
+
+    monkeypatch.setattr(weather_router, "hrrr_weather_service", _FetchLogService())
+
+    response = client.get("/api/v1/weather/hrrr/fetch-log", params={"limit": 5})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == entries
+
+
+def test_collect_sources_keeps_first_seen_order() -> None:
+    entries = [
+        weather_router.WeatherTelemetry.model_construct(source="noaa_nws, nasa_power"),
+        weather_router.WeatherTelemetry.model_construct(source="noaa_nws, nasa_power"),
+        weather_router.WeatherTelemetry.model_construct(source=None),
+        weather_router.WeatherTelemetry.model_construct(source="nasa_power,noaa_hrrr,"),
+    ]
+    assert weather_router._collect_sources(entries) == ["noaa_nws", "nasa_power", "noaa_hrrr"]